@@ -4,49 +4,69 @@ Vercel entrypoint for the FastAPI app.
 Vercel detects this file as a Python Serverless Function and looks for
 an ASGI-compatible `app` variable.
 """
-import sys
+import importlib
 import os
-from pathlib import Path
+import sys
+
+from fastapi import FastAPI
+from fastapi.responses import JSONResponse
 
 # Add project root to Python path for Vercel serverless environment
 # This ensures imports work correctly when the function is invoked
-project_root = Path(__file__).parent.parent
-if str(project_root) not in sys.path:
-    sys.path.insert(0, str(project_root))
-
-# Now import after path is set
-try:
-    from app.controller.main_controller import create_app, setup_routes
-    
-    # Create FastAPI app
-    app = create_app()
-    setup_routes(app)
-except Exception as e:
-    # If app creation fails, create a minimal error handler app
-    from fastapi import FastAPI, HTTPException
-    from fastapi.responses import JSONResponse
-    
-    app = FastAPI(title="AI Service - Error State")
-    
-    @app.get("/")
-    async def error_root():
-        return JSONResponse(
-            status_code=500,
-            content={
-                "error": "FUNCTION_INVOCATION_FAILED",
-                "message": f"Failed to initialize application: {str(e)}",
-                "type": type(e).__name__
-            }
-        )
-    
-    @app.get("/health")
-    async def error_health():
-        return JSONResponse(
-            status_code=500,
-            content={
-                "status": "unhealthy",
-                "error": "Application initialization failed"
-            }
+# Resolve once so importers see the normalized path and don't re-stat symlinks
+_root = os.path.dirname(os.path.dirname(os.path.realpath(__file__)))
+# Vercel's runtime may already export the project root via PYTHONPATH
+if _root not in os.environ.get("PYTHONPATH", "").split(os.pathsep):
+    if _root not in sys.path:
+        sys.path.insert(0, _root)
+
+
+def _cached_import(module_name: str, *names: str) -> tuple:
+    """Fetch attributes from a module, hitting sys.modules before the import machinery"""
+    module = sys.modules.get(module_name) or importlib.import_module(module_name)
+    return tuple(getattr(module, name) for name in names)
+
+
+def _install_error_routes(app: FastAPI, init_error: Exception) -> None:
+    """Serve error details instead of crashing silently when initialization fails"""
+    # The error is fixed for the life of the container, so render the
+    # responses once instead of on every probe
+    err_payload = {
+        "error": "FUNCTION_INVOCATION_FAILED",
+        "message": f"Failed to initialize application: {init_error}",
+        "type": type(init_error).__name__
+    }
+    err_response = JSONResponse(status_code=500, content=err_payload)
+    health_response = JSONResponse(
+        status_code=500,
+        content={
+            "status": "unhealthy",
+            "error": "Application initialization failed"
+        }
+    )
+
+    # A Response is itself an ASGI app, so serve the prebuilt ones directly
+    # without a handler coroutine or FastAPI's request/validation layer
+    app.add_route("/", err_response, methods=["GET"], include_in_schema=False)
+    app.add_route("/health", health_response, methods=["GET"], include_in_schema=False)
+
+
+def _build_app() -> FastAPI:
+    """Create the controller app, or the error-state app if it can't be imported"""
+    try:
+        create_app, setup_routes = _cached_import(
+            "app.controller.main_controller", "create_app", "setup_routes"
         )
+        app = create_app()
+    except (ImportError, AttributeError) as e:
+        # Broken deploy (missing dependency or symbol): serve the error state.
+        # Anything else propagates so the platform recycles the container.
+        app = FastAPI(title="AI Service - Error State")
+        _install_error_routes(app, e)
+        return app
+
+    setup_routes(app)
+    return app
 
 
+app = _build_app()
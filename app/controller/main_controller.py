@@ -1,57 +1,211 @@
 """
 Main Controller - API route handlers
 """
+import asyncio
+import functools
 import os
+import shutil
 import tempfile
 import time
-from datetime import datetime
-from typing import Tuple
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Optional, Tuple
 import re
-from urllib.parse import urlparse, urlencode
+from urllib.parse import urlparse, urlencode, parse_qsl
 
 from fastapi import FastAPI, HTTPException, UploadFile, File
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
+import aiohttp
 import httpx
+from selectolax.lexbor import LexborHTMLParser
 
 from app.db.database import get_settings
 from schemas import (
     BaseResponse, 
     HealthCheckResponse,
     VideoAnalysisResponse,
-    VideoUrlRequest
+    VideoUrlRequest,
+    BatchVideoUrlRequest,
+    BatchVideoAnalysisItem,
+    BatchVideoAnalysisResponse
 )
 from app.services.main_service import (
     VideoAnalyzer
 )
+from app.services.file_writer import AsyncFileWriter
 from loguru import logger
 
 
+# Body read size for video downloads: large chunks keep the per-chunk
+# Python/await overhead negligible next to the network transfer
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024  # 1 MiB
+
+# Drive confirmation pages (form, hidden inputs, "Download anyway" link) fit
+# well inside this; at most this much of a page is read and scanned
+DRIVE_HTML_MAX_BYTES = 128 * 1024  # 128 KiB
+
+# Video analyses never block the event loop (so /health stays responsive);
+# this bounds how many transcriptions compete for the CPU at once (calls into a
+# shared openai-whisper model are further serialized by its inference lock)
+_analysis_sem = asyncio.Semaphore(max(2, (os.cpu_count() or 2) // 2))
+
+# /analyze-videos-url: URLs accepted per request, and how many of them are
+# downloaded/analyzed at once
+MAX_BATCH_URLS = 20
+BATCH_URL_CONCURRENCY = 5
+
+
+# ==================== Video URL Patterns ====================
+# Compiled once at import; the Drive confirmation-page fallbacks run these on every retry
+_DRIVE_FILE_ID_RE = re.compile(r'/file/d/([a-zA-Z0-9_-]+)')
+_DRIVE_FILE_ID_CHARS = frozenset("abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789_-")
+_DRIVE_QUERY_ID_RE = re.compile(r'[?&]id=([a-zA-Z0-9_-]+)')
+_LOOM_SHARE_ID_RE = re.compile(r'/share/([a-zA-Z0-9]+)')
+
+# Video container signatures: (label, ((offset, bytes), ...)); every pair in a row must match
+_VIDEO_MAGIC = (
+    ("mp4", ((4, b'ftyp'),)),  # MP4/MOV/M4V (ISO base media)
+    # Classic QuickTime .mov files have no ftyp box and open with another top-level atom
+    ("mov", ((4, b'moov'),)),
+    ("mov", ((4, b'mdat'),)),
+    ("mov", ((4, b'wide'),)),
+    ("mov", ((4, b'free'),)),
+    ("mov", ((4, b'skip'),)),
+    ("mkv", ((0, b'\x1a\x45\xdf\xa3'),)),  # WebM/MKV (EBML header)
+    ("avi", ((0, b'RIFF'), (8, b'AVI '))),  # AVI (RIFF....AVI )
+    ("flv", ((0, b'FLV'),)),  # FLV
+    ("wmv", ((0, b'\x30\x26\xb2\x75\x8e\x66\xcf\x11'),)),  # WMV (ASF header GUID)
+)
+
+# Content-Type (without parameters) -> file extension
+_MIME_EXT = {
+    "video/mp4": ".mp4",
+    "video/webm": ".webm",
+    "video/quicktime": ".mov",
+    "video/mov": ".mov",
+    "video/x-msvideo": ".avi",
+}
+
+# Container extensions accepted for analysis (uploads and downloaded files)
+_ALLOWED_VIDEO_EXT = frozenset({'.mp4', '.mov', '.avi', '.mkv', '.webm', '.flv', '.wmv', '.m4v'})
+# Listed in error messages; joined once instead of on every rejected request
+_ALLOWED_VIDEO_EXT_LIST = ", ".join(sorted(_ALLOWED_VIDEO_EXT))
+
+# Hosts serving resolved, signed download URLs (no cookies or confirmation needed)
+_SIGNED_CDN_HOSTS = frozenset({"drive.usercontent.google.com", "cdn.loom.com"})
+
+# The confirmation-page patterns run on the raw response bytes, so the page
+# never has to be decoded; only the short captured value is
+# Download URL assigned in inline JavaScript (var/const url = ..., href: ..., downloadUrl = ...)
+_DRIVE_JS_URL_RE = re.compile(
+    rb'(?:(?:var|const)\s+url\s*=|(?:href|downloadUrl|download_url)\s*[:=])'
+    rb'\s*["\']([^"\']*uc\?export=download[^"\']*)["\']',
+    re.IGNORECASE
+)
+
+# Confirmation token in scripts/text when it isn't in the form's hidden inputs;
+# each alternative has one group, read via lastindex
+_CONFIRM_RE = re.compile(
+    rb'var\s+uc_download_token\s*=\s*["\']([^"\']+)["\']'
+    rb'|confirm(?:=|\\x3d)([a-zA-Z0-9_-]+)'
+    rb'|t\.action\s*=\s*["\']([^"\']*uc\?export=download[^"\']*)["\']',
+    re.IGNORECASE
+)
+
+
+def _mime_type(content_type: str) -> str:
+    """Bare, lowercased media type from a Content-Type header ("video/mp4; codecs=..." -> "video/mp4")"""
+    return content_type.partition(";")[0].strip().lower()
+
+
+def _is_file_response(mime_type: str, content_length: Optional[str]) -> bool:
+    """True if the response headers rule out a Drive confirmation page (small text/html)"""
+    if mime_type.startswith("video/") or mime_type == "application/octet-stream":
+        return True
+    # Confirmation pages are a few KiB; anything over 1 MiB is the file
+    return bool(content_length and content_length.isdigit() and int(content_length) > 1024 * 1024)
+
+
+def _normalize_drive_url(raw_url: str) -> str:
+    """Unescape a Google Drive download link and make it absolute"""
+    url = raw_url.replace('\\x3d', '=').replace('\\/', '/')
+    if url.startswith('http'):
+        return url
+    if url.startswith('/'):
+        return f"https://drive.google.com{url}"
+    return f"https://drive.google.com/{url}"
+
+
+def _extract_drive_file_id(url: str) -> Optional[str]:
+    """Pull the file ID out of a drive.google.com/file/d/<id>/... share link"""
+    start = url.find('/file/d/')
+    if start == -1:
+        return None
+    tail = url[start + 8:]
+    end = len(tail)
+    for sep in '/?#':
+        i = tail.find(sep)
+        if i != -1 and i < end:
+            end = i
+    file_id = tail[:end]
+    if file_id and set(file_id) <= _DRIVE_FILE_ID_CHARS:
+        return file_id
+    # Unusual trailing characters: keep the regex's longest-valid-prefix behaviour
+    match = _DRIVE_FILE_ID_RE.search(url)
+    return match.group(1) if match else None
+
+
+def _attempt_key(url: str, file_id: Optional[str]) -> object:
+    """
+    Identify a download attempt for retry de-duplication
+    
+    Drive attempts are keyed on (file_id, confirm, uuid, at) so variants of
+    the same request that differ only in host or parameter order collapse
+    together; other URLs are keyed on the URL itself.
+    """
+    if not file_id:
+        return url
+    params = dict(parse_qsl(urlparse(url).query))
+    return (
+        file_id,
+        params.get('confirm') or None,
+        params.get('uuid') or None,
+        params.get('at') or None,
+    )
+
+
+async def _prepend_chunk(first_chunk: bytes, chunks: AsyncIterator[bytes]) -> AsyncIterator[bytes]:
+    """Yield an already-read chunk ahead of the rest of a response body"""
+    if first_chunk:
+        yield first_chunk
+    async for chunk in chunks:
+        yield chunk
+
+
 # Setup - Lazy initialization to avoid errors during import
-_settings = None
 _logger_configured = False
 
+@functools.lru_cache(maxsize=1)
 def _get_settings():
     """Lazy load settings to avoid initialization errors during import"""
-    global _settings
-    if _settings is None:
-        try:
-            _settings = get_settings()
-            _settings.SERVICE_NAME = "ai-service"
-        except Exception as e:
-            logger.warning(f"Failed to load settings: {e}. Using defaults.")
-            # Create a minimal settings object if loading fails
-            from types import SimpleNamespace
-            _settings = SimpleNamespace(
-                SERVICE_NAME="ai-service",
-                GEMINI_API_KEY=os.getenv("GEMINI_API_KEY"),
-                WHISPER_MODEL=os.getenv("WHISPER_MODEL", "base"),
-                MAX_VIDEO_SIZE_MB=int(os.getenv("MAX_VIDEO_SIZE_MB", "5000")),
-                USE_ALTERNATIVE_TRANSCRIPTION=os.getenv("USE_ALTERNATIVE_TRANSCRIPTION", "True").lower() == "true",
-                TRANSCRIPTION_SERVICE=os.getenv("TRANSCRIPTION_SERVICE", "assemblyai"),
-                TRANSCRIPTION_API_KEY=os.getenv("TRANSCRIPTION_API_KEY"),
-                LOG_LEVEL=os.getenv("LOG_LEVEL", "INFO")
-            )
-    return _settings
+    try:
+        settings = get_settings()
+        settings.SERVICE_NAME = "ai-service"
+    except Exception as e:
+        logger.warning(f"Failed to load settings: {e}. Using defaults.")
+        # Create a minimal settings object if loading fails
+        from types import SimpleNamespace
+        settings = SimpleNamespace(
+            SERVICE_NAME="ai-service",
+            GEMINI_API_KEY=os.getenv("GEMINI_API_KEY"),
+            WHISPER_MODEL=os.getenv("WHISPER_MODEL", "base"),
+            MAX_VIDEO_SIZE_MB=int(os.getenv("MAX_VIDEO_SIZE_MB", "5000")),
+            USE_ALTERNATIVE_TRANSCRIPTION=os.getenv("USE_ALTERNATIVE_TRANSCRIPTION", "True").lower() == "true",
+            TRANSCRIPTION_SERVICE=os.getenv("TRANSCRIPTION_SERVICE", "assemblyai"),
+            TRANSCRIPTION_API_KEY=os.getenv("TRANSCRIPTION_API_KEY"),
+            LOG_LEVEL=os.getenv("LOG_LEVEL", "INFO")
+        )
+    return settings
 
 def _configure_logger():
     """Configure logger - lazy initialization to avoid errors during import"""
@@ -99,6 +253,129 @@ def _configure_logger():
         _logger_configured = True
 
 
+def _download_timeout(max_size_mb: int) -> httpx.Timeout:
+    """Download timeout scaled to the size limit"""
+    # Increase timeout for large files - allow up to 10 minutes for download
+    # Calculate timeout based on file size limit (roughly 1 minute per 100MB with margin)
+    timeout_seconds = max(300.0, (max_size_mb / 100) * 60)  # At least 5 minutes, more for larger limits
+    return httpx.Timeout(timeout_seconds, connect=30.0)
+
+
+class _SharedPoolTransport(httpx.AsyncBaseTransport):
+    """Send through the app-wide connection pool; closing a client built on it leaves the pool open"""
+    
+    def __init__(self, pool: httpx.AsyncHTTPTransport):
+        self._pool = pool
+    
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        return await self._pool.handle_async_request(request)
+
+
+def _download_client(pool: httpx.AsyncHTTPTransport) -> httpx.AsyncClient:
+    """
+    HTTP client for one download, on the shared connection pool
+    
+    Each download gets its own cookie jar, so Drive confirmation cookies
+    (download_warning, NID) picked up for one user are never sent on
+    another user's download. Building the client is cheap; connections and
+    TLS sessions still come from the pool. Per-download timeouts are passed
+    on each request (see _download_timeout). Redirects (the Drive
+    uc -> usercontent chain) are followed client-wide.
+    """
+    return httpx.AsyncClient(
+        transport=_SharedPoolTransport(pool),
+        timeout=httpx.Timeout(60.0, connect=10.0),
+        follow_redirects=True
+    )
+
+
+@asynccontextmanager
+async def _lifespan(app: FastAPI):
+    """Own the shared HTTP connection pool for the life of the app"""
+    # Downloads and Drive retries reuse pooled connections and TLS sessions
+    # instead of handshaking per request
+    async with httpx.AsyncHTTPTransport(
+        http2=True,
+        limits=httpx.Limits(max_keepalive_connections=20, max_connections=100)
+    ) as http_pool:
+        app.state.http_pool = http_pool
+        # One analyzer for the life of the app, so the Gemini client setup and
+        # the lazily loaded Whisper model are reused across requests
+        app.state.analyzer = await asyncio.to_thread(_build_analyzer)
+        if app.state.analyzer is not None:
+            # Load Whisper now so the first request starts warm
+            await asyncio.to_thread(app.state.analyzer.warmup)
+        yield
+
+
+def _build_analyzer() -> Optional[VideoAnalyzer]:
+    """
+    Create the shared video analyzer from settings
+    
+    Returns:
+        The analyzer, or None if GEMINI_API_KEY is missing or setup failed
+        (the analysis endpoints then answer 500 instead of the app failing)
+    """
+    settings = _get_settings()
+    if not settings.GEMINI_API_KEY:
+        logger.warning("GEMINI_API_KEY is not configured; video analysis endpoints are disabled")
+        return None
+    try:
+        return VideoAnalyzer(
+            gemini_api_key=settings.GEMINI_API_KEY,
+            whisper_model=settings.WHISPER_MODEL,
+            compute_type=getattr(settings, 'WHISPER_COMPUTE_TYPE', 'auto'),
+            use_alternative_transcription=getattr(settings, 'USE_ALTERNATIVE_TRANSCRIPTION', False),
+            transcription_service=getattr(settings, 'TRANSCRIPTION_SERVICE', 'whisper'),
+            transcription_api_key=getattr(settings, 'TRANSCRIPTION_API_KEY', None),
+            analysis_cache_dir=getattr(settings, 'ANALYSIS_CACHE_DIR', None)
+        )
+    except Exception as e:
+        logger.error(f"Failed to initialize video analyzer: {e}", exc_info=True)
+        return None
+
+
+def _require_analyzer(app: FastAPI) -> VideoAnalyzer:
+    """Return the app's shared analyzer, or raise a 500 explaining why there is none"""
+    analyzer = getattr(app.state, "analyzer", None)
+    if analyzer is not None:
+        return analyzer
+    if not _get_settings().GEMINI_API_KEY:
+        raise HTTPException(
+            status_code=500,
+            detail="GEMINI_API_KEY is not configured. Please set it in your .env file."
+        )
+    raise HTTPException(
+        status_code=500,
+        detail="Video analyzer failed to initialize. Check the server logs for details."
+    )
+
+
+# Fallbacks for fields the analysis result may omit; tuples so the shared
+# values can't be mutated (pydantic converts them to lists)
+_ANALYSIS_DEFAULTS = {
+    "is_interview": True,
+    "summary": "",
+    "key_questions": (),
+    "tone_and_professionalism": "",
+    "rating": 0.0,
+    "technical_strengths": (),
+    "technical_weaknesses": (),
+    "communication_rating": 0.0,
+    "technical_knowledge_rating": 0.0,
+    "follow_up_questions": (),
+    "interviewer_review": "Interviewer review not available",
+    "transcript": None,
+}
+
+
+def _build_analysis_response(result: dict, processing_time: float) -> VideoAnalysisResponse:
+    """Validate an analysis result into the response model, filling in missing fields"""
+    return VideoAnalysisResponse.model_validate(
+        {**_ANALYSIS_DEFAULTS, **result, "processing_time": processing_time}
+    )
+
+
 def create_app() -> FastAPI:
     """Create and configure FastAPI application"""
     # Configure logger before creating app
@@ -107,7 +384,11 @@ def create_app() -> FastAPI:
     app = FastAPI(
         title="AI Service",
         description="AI and Machine Learning service",
-        version="1.0.0"
+        version="1.0.0",
+        lifespan=_lifespan,
+        # Analysis responses carry long transcripts and many lists; orjson
+        # serializes them several times faster than the stdlib encoder
+        default_response_class=ORJSONResponse
     )
     
     # CORS Middleware
@@ -122,223 +403,276 @@ def create_app() -> FastAPI:
     return app
 
 
-def _is_valid_video_file(file_path: str, first_bytes: bytes = None) -> bool:
-    """Validate that a file is actually a valid video file by checking file magic bytes"""
-    try:
-        # Video file magic numbers (file signatures)
-        video_signatures = {
-            b'\x00\x00\x00\x20ftypisom',  # MP4 ISO Media
-            b'\x00\x00\x00\x18ftypmp41',  # MP4 v1
-            b'\x00\x00\x00\x18ftypmp42',  # MP4 v2
-            b'\x00\x00\x00\x1cftypmp41',  # MP4
-            b'\x00\x00\x00\x20ftypmp41',  # MP4
-            b'ftyp',  # MP4/MOV (usually starts with ftyp)
-            
-            # QuickTime/MOV files
-            b'\x00\x00\x00\x14ftypqt  ',  # QuickTime
-            b'\x00\x00\x00\x20ftypqt  ',  # QuickTime
-            
-            # WebM files
-            b'\x1a\x45\xdf\xa3',  # WebM (EBML header)
-            
-            # AVI files
-            b'RIFF',  # AVI files start with RIFF
-            
-            # FLV files
-            b'FLV',
-            
-            # MKV files
-            b'\x1a\x45\xdf\xa3',  # Matroska (same as WebM)
-        }
-        
-        # Read first bytes from file if not provided
-        if first_bytes is None or len(first_bytes) < 4:
-            with open(file_path, "rb") as f:
-                first_bytes = f.read(16)
-        
-        if len(first_bytes) < 4:
-            return False
-        
-        # Check for common video file signatures
-        # Check for MP4/MOV (ftyp at offset 4)
-        if len(first_bytes) >= 8 and first_bytes[4:8] == b'ftyp':
+def _has_video_magic(first_bytes: bytes) -> bool:
+    """Check the first bytes of a file against the known video container signatures"""
+    # startswith at an offset compares in place, without slicing
+    for label, checks in _VIDEO_MAGIC:
+        if all(first_bytes.startswith(sig, offset) for offset, sig in checks):
+            logger.debug("Detected {} container signature", label)
             return True
-        
-        # Check for WebM/MKV (EBML header)
-        if first_bytes[:4] == b'\x1a\x45\xdf\xa3':
-            return True
-        
-        # Check for AVI (RIFF...AVI)
-        if first_bytes[:4] == b'RIFF':
-            # Check if it contains AVI header (at offset 8)
-            if len(first_bytes) >= 12 and b'AVI' in first_bytes[8:12]:
-                return True
-        
-        # Check for FLV
-        if first_bytes[:3] == b'FLV':
-            return True
-        
-        # Additional check: if file extension is known video format and file size is reasonable
-        file_ext = os.path.splitext(file_path)[1].lower()
-        video_extensions = {'.mp4', '.mov', '.avi', '.mkv', '.webm', '.flv', '.wmv', '.m4v'}
-        if file_ext in video_extensions:
-            # Check file size (should be at least a few KB for a video)
-            file_size = os.path.getsize(file_path)
-            if file_size > 1024:  # At least 1KB
-                # Try using ffprobe as a last resort to validate
-                try:
-                    import subprocess
-                    result = subprocess.run(
-                        ["ffprobe", "-v", "error", "-show_entries", "format=format_name", 
-                         "-of", "default=noprint_wrappers=1:nokey=1", file_path],
-                        capture_output=True,
-                        timeout=5,
-                        check=True
-                    )
-                    # If ffprobe succeeded, it's a valid video file
-                    return True
-                except (subprocess.CalledProcessError, subprocess.TimeoutExpired, FileNotFoundError):
-                    return False
-        
-        return False
-        
-    except Exception as e:
-        logger.warning(f"Error validating video file: {e}")
-        return False
+    return False
 
 
-async def download_video_from_url(url: str, output_path: str, filename_hint: str = None, file_id: str = None, is_retry: bool = False, retry_count: int = 0, tried_urls: set = None) -> Tuple[str, float]:
+async def _save_video_stream(
+    chunks: AsyncIterator[bytes],
+    output_path: str,
+    file_extension: Optional[str],
+    mime_type: str,
+    max_size_mb: int,
+    content_length: Optional[str] = None
+) -> Tuple[str, float]:
     """
-    Download video from URL (supports Google Drive, Loom, and generic URLs)
+    Write a video response body to disk, checking magic bytes first and enforcing the size limit
     
-    Args:
-        url: Video URL to download
-        output_path: Path to save the downloaded video
-        filename_hint: Optional filename hint for file extension detection
-        file_id: Optional Google Drive file ID (for retries)
-        is_retry: Whether this is a retry attempt (skip URL validation)
-        retry_count: Current retry attempt count (prevents infinite loops)
-        tried_urls: Set of URLs already tried (prevents retrying same URL)
+    content_length, when it is within the limit, is used to preallocate the file.
     
     Returns:
         Tuple of (downloaded_file_path, file_size_mb)
-    
-    Raises:
-        HTTPException: For various error conditions with appropriate status codes
     """
-    # Initialize tried_urls set if not provided
-    if tried_urls is None:
-        tried_urls = set()
+    # Determine file extension from Content-Type if not already set
+    if not file_extension or file_extension == ".mp4":
+        # Some servers don't send a proper content-type (e.g. application/octet-stream);
+        # keep the extension from the filename or default to .mp4
+        file_extension = _MIME_EXT.get(mime_type, file_extension or ".mp4")
     
-    # Prevent infinite loops - max 3 retries
-    MAX_RETRIES = 3
-    if retry_count >= MAX_RETRIES:
-        raise HTTPException(
-            status_code=400,
-            detail=f"Unable to download Google Drive file after {MAX_RETRIES} attempts. The file may require manual confirmation or may not be publicly accessible. Please ensure the file is shared with 'Anyone with the link' permission."
-        )
+    # Update output path with correct extension
+    final_output_path = output_path
+    if not output_path.endswith(file_extension):
+        final_output_path = os.path.splitext(output_path)[0] + file_extension
+    
+    # Validate the body is actually a video file before anything touches the disk
+    first_bytes = b""
+    head_chunks = []
+    async for chunk in chunks:
+        head_chunks.append(chunk)
+        first_bytes += chunk[:12 - len(first_bytes)]  # First 12 bytes for magic number check
+        if len(first_bytes) >= 12:
+            break
     
-    # Check if we've already tried this exact URL
-    if url in tried_urls:
+    if not _has_video_magic(first_bytes):
         raise HTTPException(
             status_code=400,
-            detail="Unable to download Google Drive file. The confirmation method is not working. Please try using a direct download link or ensure the file is publicly accessible."
+            detail="The downloaded file is not a valid video file. The URL may have returned HTML or a corrupted file. Please verify the URL points directly to a video file."
         )
     
-    tried_urls.add(url)
-    try:
-        # Validate URL format (skip if retry)
-        if not is_retry:
-            parsed_url = urlparse(url)
-            if not parsed_url.scheme or not parsed_url.netloc:
+    # Download with progress tracking and validation
+    total_size = 0
+    max_size_bytes = max_size_mb << 20
+    size_hint = None
+    if content_length and content_length.isdigit() and int(content_length) <= max_size_bytes:
+        size_hint = int(content_length)
+    
+    async with AsyncFileWriter(final_output_path, size_hint=size_hint) as f:
+        async for chunk in _prepend_chunk(b"".join(head_chunks), chunks):
+            total_size += len(chunk)
+            
+            # Check size during download
+            if total_size > max_size_bytes:
+                # Clean up partial download
+                try:
+                    os.remove(final_output_path)
+                except:
+                    pass
                 raise HTTPException(
                     status_code=400,
-                    detail="Invalid URL format. Please provide a valid URL."
+                    detail=f"Video file size exceeds maximum allowed size ({max_size_mb} MB)"
                 )
-        
-        # Handle Google Drive links (only on first attempt or if file_id not provided)
-        original_url = url
-        if not file_id and "drive.google.com" in url.lower():
-            logger.info("Detected Google Drive link, converting to direct download URL")
-            # Convert Google Drive share link to direct download link
-            file_id_match = re.search(r'/file/d/([a-zA-Z0-9_-]+)', url)
-            if file_id_match:
-                file_id = file_id_match.group(1)
-                download_url = f"https://drive.google.com/uc?export=download&id={file_id}"
-                url = download_url
-            else:
-                # Also try to extract from confirm URLs (retry case)
-                file_id_match = re.search(r'[?&]id=([a-zA-Z0-9_-]+)', url)
-                if file_id_match:
-                    file_id = file_id_match.group(1)
-                    # Already a download URL, use as is
-                else:
-                    raise HTTPException(
-                        status_code=400,
-                        detail="Invalid Google Drive URL. Please provide a shareable Google Drive link."
-                    )
-        
-        # Handle Loom links
-        elif "loom.com" in url.lower() or "loom.share" in url.lower():
-            logger.info("Detected Loom link, attempting to extract video URL")
-            # Loom videos can be accessed via their API or direct video URL
-            # For public videos, we can try to get the video URL
-            # This might require the loom.com/share format
-            if "/share/" in url:
-                # Extract the video ID from Loom URL
-                loom_id_match = re.search(r'/share/([a-zA-Z0-9]+)', url)
-                if loom_id_match:
-                    loom_id = loom_id_match.group(1)
-                    # Try to get the video URL (Loom might require different approach)
-                    # For now, try the direct video URL format
-                    url = f"https://cdn.loom.com/sessions/videos/{loom_id}/transcoded.mp4"
-                    logger.info(f"Converted Loom URL to: {url}")
-        
-        # Determine file extension from filename hint or Content-Type header
-        file_extension = None
-        if filename_hint:
-            file_extension = os.path.splitext(filename_hint)[1].lower()
-        
+            
+            await f.write(chunk)
+    
+    file_size_mb = total_size / (1024 * 1024)
+    logger.info("Video downloaded: {} (Size: {:.2f} MB)", final_output_path, file_size_mb)
+    return final_output_path, file_size_mb
+
+
+async def _fast_fetch(
+    url: str,
+    output_path: str,
+    file_extension: Optional[str],
+    timeout_seconds: float,
+    max_size_mb: int
+) -> Optional[Tuple[str, float]]:
+    """
+    Bulk-download an already-resolved signed CDN URL with aiohttp
+    
+    These URLs need no cookies or redirect handling, so the transfer skips
+    httpx's streaming layer. Returns None when the caller should fall back
+    to the regular httpx download (non-200, HTML page, or transport error).
+    """
+    # Same semantics as the httpx path: timeout_seconds bounds each read, not
+    # the whole transfer, so large videos on slow links still complete
+    timeout = aiohttp.ClientTimeout(total=None, sock_connect=30.0, sock_read=timeout_seconds)
+    try:
+        async with aiohttp.ClientSession(timeout=timeout) as session:
+            async with session.get(url) as response:
+                mime_type = _mime_type(response.headers.get("content-type", ""))
+                if response.status != 200 or mime_type == "text/html":
+                    return None
+                
+                logger.opt(lazy=True).info("Fetching resolved download URL directly: {}...", lambda: url[:100])
+                return await _save_video_stream(
+                    response.content.iter_chunked(DOWNLOAD_CHUNK_SIZE),
+                    output_path,
+                    file_extension,
+                    mime_type,
+                    max_size_mb,
+                    response.headers.get("content-length")
+                )
+    except asyncio.TimeoutError:
+        raise HTTPException(
+            status_code=408,
+            detail="Request timeout. The video download took too long. Please check your connection and try again."
+        )
+    except aiohttp.ClientError as e:
+        logger.warning(f"Direct fetch failed, falling back to httpx: {e}")
+        return None
+
+
+def _parse_drive_confirmation_html(html_content: bytes) -> dict:
+    """
+    Extract the download link and confirmation fields from a Google Drive confirmation page
+    
+    CPU-bound (DOM parse + regex scan); called through asyncio.to_thread.
+    
+    Returns:
+        Dict with confirm_token, uuid, at, authuser, export and download_url_found
+    """
+    # Parse the page once and read the form/links from the DOM
+    tree = LexborHTMLParser(html_content)
+    
+    # Method 1: Look for the "Download anyway" button specifically
+    # This button appears when Google Drive can't scan large files
+    download_url_found = None
+    download_links = tree.css('a[href*="uc?export=download"]')
+    for node in download_links:
+        if "download anyway" in node.text().lower():
+            download_url_found = _normalize_drive_url(node.attributes.get('href') or '')
+            logger.info("Found 'Download anyway' button link: {}", download_url_found)
+            break
+    
+    # Method 1b: Look for any download link or form in the confirmation page (if Download anyway not found)
+    if not download_url_found:
+        link = download_links[0].attributes.get('href') if download_links else None
+        if not link:
+            form = tree.css_first('form[action*="uc?export=download"]')
+            link = form.attributes.get('action') if form else None
+        if link:
+            download_url_found = _normalize_drive_url(link)
+            logger.info("Found download link in HTML: {}", download_url_found)
+    
+    # Method 2: Look for JavaScript variables containing download URLs
+    # Google Drive sometimes stores the download URL in JavaScript variables
+    if not download_url_found:  # Only use if we didn't find a better one
+        match = _DRIVE_JS_URL_RE.search(html_content)
+        if match:
+            download_url_found = _normalize_drive_url(match.group(1).decode('utf-8', errors='ignore'))
+            logger.info("Found download URL in JavaScript: {}", download_url_found)
+    
+    # Method 3: Extract all hidden input fields from the form (PRIORITY - this is the working format)
+    # Google Drive uses hidden inputs for confirm, uuid, at, etc.
+    # This method builds the working URL: https://drive.usercontent.google.com/download
+    hidden_inputs = {}
+    for node in tree.css('input[type="hidden"]'):
+        input_name = node.attributes.get('name')
+        if input_name and input_name not in hidden_inputs:  # Don't overwrite existing values
+            hidden_inputs[input_name] = node.attributes.get('value') or ''
+            logger.debug("Found hidden input: {} = {}", input_name, hidden_inputs[input_name])
+    
+    if hidden_inputs:
+        logger.info("Extracted {} hidden input fields from form", len(hidden_inputs))
+    
+    # Extract specific important fields
+    confirm_token = hidden_inputs.get('confirm') or hidden_inputs.get('t')
+    uuid_value = hidden_inputs.get('uuid')
+    at_value = hidden_inputs.get('at')
+    authuser_value = hidden_inputs.get('authuser', '0')
+    export_value = hidden_inputs.get('export', '')
+    
+    # The download link's query usually carries the same fields; read it in one pass
+    if download_url_found and not (confirm_token and uuid_value and at_value):
+        link_params = dict(parse_qsl(urlparse(download_url_found).query))
+        confirm_token = confirm_token or link_params.get('confirm')
+        uuid_value = uuid_value or link_params.get('uuid')
+        at_value = at_value or link_params.get('at')
+    
+    # Also try script/text patterns for confirm token if not found in the form or link
+    if not confirm_token:
+        match = _CONFIRM_RE.search(html_content)
+        if match:
+            confirm_token = match.group(match.lastindex).decode('utf-8', errors='ignore')
+            logger.info("Found confirmation token via pattern: {}", confirm_token)
+    
+    return {
+        'confirm_token': confirm_token,
+        'uuid': uuid_value,
+        'at': at_value,
+        'authuser': authuser_value,
+        'export': export_value,
+        'download_url_found': download_url_found,
+    }
+
+
+class _RetryWithUrls(Exception):
+    """A Drive confirmation page was returned; carries the candidate URLs to try next"""
+    
+    def __init__(self, urls: list):
+        super().__init__(f"{len(urls)} candidate download URLs")
+        self.urls = urls
+
+
+async def _download_attempt(
+    url: str,
+    output_path: str,
+    client: httpx.AsyncClient,
+    file_extension: Optional[str],
+    file_id: Optional[str],
+    retry_count: int,
+    max_size_mb: int,
+    timeout: httpx.Timeout
+) -> Tuple[str, float]:
+    """
+    Make one download request
+    
+    Raises:
+        _RetryWithUrls: Google Drive returned a confirmation page instead of the file
+        HTTPException: For various error conditions with appropriate status codes
+    """
+    try:
         # Download the video with proper headers
-        logger.info(f"Downloading video from URL: {url}")
-        # Increase timeout for large files - allow up to 10 minutes for download
-        max_size_mb = _get_settings().MAX_VIDEO_SIZE_MB
-        # Calculate timeout based on file size limit (roughly 1 minute per 100MB with margin)
-        timeout_seconds = max(300.0, (max_size_mb / 100) * 60)  # At least 5 minutes, more for larger limits
-        timeout = httpx.Timeout(timeout_seconds, connect=30.0)
+        logger.info("Downloading video from URL: {}", url)
         
-        async with httpx.AsyncClient(timeout=timeout, follow_redirects=True) as client:
+        # Retries and resolved signed URLs are known direct downloads; the GET
+        # response carries the same headers and the size limit is enforced
+        # while streaming, so skip the extra round trip
+        url_host = urlparse(url).hostname
+        skip_head = retry_count > 0 or url_host in _SIGNED_CDN_HOSTS
+        
+        if skip_head:
+            file_extension = file_extension or ".mp4"
+        else:
             # First, make a HEAD request to check content type and size
             try:
-                head_response = await client.head(url)
+                head_response = await client.head(url, timeout=timeout)
                 head_response.raise_for_status()
                 
                 # Check if it's a video content type
-                content_type = head_response.headers.get("content-type", "").lower()
+                content_type = head_response.headers.get("content-type", "")
                 content_length = head_response.headers.get("content-length")
                 
                 if content_length:
                     file_size_mb = int(content_length) / (1024 * 1024)
-                    max_size_mb = _get_settings().MAX_VIDEO_SIZE_MB
                     if file_size_mb > max_size_mb:
                         raise HTTPException(
                             status_code=400,
                             detail=f"Video file size ({file_size_mb:.2f} MB) exceeds maximum allowed size ({max_size_mb} MB). Please use a smaller file or increase MAX_VIDEO_SIZE_MB in your configuration."
                         )
                     else:
-                        logger.info(f"File size check passed: {file_size_mb:.2f} MB (limit: {max_size_mb} MB)")
+                        logger.info("File size check passed: {:.2f} MB (limit: {} MB)", file_size_mb, max_size_mb)
                 
                 # Determine extension from Content-Type if not already set
                 if not file_extension:
-                    if "video/mp4" in content_type:
-                        file_extension = ".mp4"
-                    elif "video/webm" in content_type:
-                        file_extension = ".webm"
-                    elif "video/quicktime" in content_type or "video/mov" in content_type:
-                        file_extension = ".mov"
-                    elif "video/x-msvideo" in content_type:
-                        file_extension = ".avi"
-                    else:
+                    file_extension = _MIME_EXT.get(_mime_type(content_type))
+                    if not file_extension:
                         # Default to mp4 if we can't determine
                         file_extension = ".mp4"
                         logger.warning(f"Could not determine file type from Content-Type: {content_type}, defaulting to .mp4")
@@ -347,335 +681,104 @@ async def download_video_from_url(url: str, output_path: str, filename_hint: str
                 # HEAD might not be supported, continue with GET
                 logger.warning(f"HEAD request failed, will try GET: {e}")
                 file_extension = file_extension or ".mp4"
+        
+        # Resolved Drive/Loom download URLs are plain signed GETs - fetch them directly
+        if url_host in _SIGNED_CDN_HOSTS:
+            fetched = await _fast_fetch(url, output_path, file_extension, timeout.read, max_size_mb)
+            if fetched:
+                return fetched
+        
+        # Now download the actual video
+        async with client.stream("GET", url, timeout=timeout) as response:
+            response.raise_for_status()
             
-            # Now download the actual video
-            async with client.stream("GET", url, follow_redirects=True) as response:
-                response.raise_for_status()
-                
-                # Check Content-Type from GET response if HEAD failed
-                content_type = response.headers.get("content-type", "").lower()
-                
-                # Special handling for Google Drive - check if we got HTML (confirmation page)
-                if file_id and "text/html" in content_type:
-                    logger.warning(f"Received HTML from Google Drive (confirmation page, attempt {retry_count + 1}/{MAX_RETRIES})")
-                    max_size_mb = _get_settings().MAX_VIDEO_SIZE_MB  # Get size limit for error messages
-                    
+            # Check Content-Type from GET response if HEAD failed; parsed once
+            # and reused for the sniff decision and the extension lookup
+            mime_type = _mime_type(response.headers.get("content-type", ""))
+            
+            # Special handling for Google Drive - sniff the first chunk to tell a
+            # confirmation page (HTML) from the file itself, unless the headers
+            # already say this is the file
+            may_be_html = bool(file_id) and not _is_file_response(mime_type, response.headers.get("content-length"))
+            
+            # The body can only be iterated once, so the sniff below and the
+            # file write share this iterator. When it may be a confirmation page,
+            # chunks are capped at DRIVE_HTML_MAX_BYTES so no more than that is
+            # buffered for the page; a video is still coalesced into large writes
+            # by AsyncFileWriter
+            chunk_size = DRIVE_HTML_MAX_BYTES if may_be_html else DOWNLOAD_CHUNK_SIZE
+            chunks = response.aiter_bytes(chunk_size=chunk_size)
+            prebuffered = b""
+            
+            if may_be_html:
+                prebuffered = await anext(chunks, b"")
+                sniff = prebuffered[:1000].lower()
+                if sniff.startswith(b"<!doctype") or sniff.startswith(b"<html") or b"<html" in sniff:
                     # Read more HTML content to get the full page
                     # Google Drive confirmation pages can be large, read more to find download links
-                    html_chunk = b""
-                    async for chunk in response.aiter_bytes(chunk_size=8192):
-                        html_chunk += chunk
-                        # Read up to 512KB to ensure we get the full page including any download links
-                        if len(html_chunk) >= 524288:  # 512KB
-                            break
-                    
-                    if html_chunk.startswith(b"<!DOCTYPE") or html_chunk.startswith(b"<html") or b"<html" in html_chunk[:1000].lower():
-                        # Try to extract the download confirmation token from HTML
-                        html_content = html_chunk.decode('utf-8', errors='ignore')
-                        
-                        logger.debug(f"HTML content preview: {html_content[:1000]}...")
-                        
-                        # Log if we found "Download anyway" text for debugging
-                        if "download anyway" in html_content.lower():
-                            logger.info("Found 'Download anyway' text in HTML - attempting to extract download link")
-                        
-                        # Also check for the virus scan warning specifically
-                        if "can't scan this file for viruses" in html_content.lower() or "too large for google to scan" in html_content.lower():
-                            logger.info("Detected Google Drive virus scan warning page")
-                        
-                        # Method 1: Look for the "Download anyway" button specifically
-                        # This button appears when Google Drive can't scan large files
-                        download_anyway_patterns = [
-                            # Link with "Download anyway" text
-                            r'<a[^>]*href="([^"]*uc\?export=download[^"]*)"[^>]*>.*?Download anyway.*?</a>',
-                            r'<a[^>]*>.*?Download anyway.*?</a>[^>]*href="([^"]*uc\?export=download[^"]*)"',
-                            r'Download anyway[^<]*<a[^>]*href="([^"]*uc\?export=download[^"]*)"',
-                            # Button with onclick redirecting to download
-                            r'<button[^>]*onclick="[^"]*window\.location\.href\s*=\s*[\'"]([^\'"]*uc\?export=download[^\'"]*)[\'"]',
-                            r'<button[^>]*>.*?Download anyway.*?</button>.*?window\.location\.href\s*=\s*[\'"]([^\'"]*uc\?export=download[^\'"]*)[\'"]',
-                            # Form action with download URL
-                            r'<form[^>]*action="([^"]*uc\?export=download[^"]*)"[^>]*>.*?Download anyway.*?</form>',
-                            r'Download anyway.*?<form[^>]*action="([^"]*uc\?export=download[^"]*)"',
-                            # Generic JavaScript redirect patterns
-                            r'window\.location\.href\s*=\s*[\'"]([^\'"]*uc\?export=download[^\'"]*)[\'"]',
-                            r'location\.href\s*=\s*[\'"]([^\'"]*uc\?export=download[^\'"]*)[\'"]',
-                        ]
-                        
-                        download_url_found = None
-                        for pattern in download_anyway_patterns:
-                            match = re.search(pattern, html_content, re.IGNORECASE | re.DOTALL)
-                            if match:
-                                download_url_found = match.group(1)
-                                # Clean up the URL (remove escape sequences if any)
-                                download_url_found = download_url_found.replace('\\x3d', '=').replace('\\/', '/')
-                                if not download_url_found.startswith('http'):
-                                    if download_url_found.startswith('/'):
-                                        download_url_found = f"https://drive.google.com{download_url_found}"
-                                    else:
-                                        download_url_found = f"https://drive.google.com/{download_url_found}"
-                                logger.info(f"Found 'Download anyway' button link: {download_url_found}")
-                                break
-                        
-                        # Method 1b: Look for any download link in the confirmation page (if Download anyway not found)
-                        if not download_url_found:
-                            download_link_patterns = [
-                                r'<a[^>]*href="([^"]*uc\?export=download[^"]*)"[^>]*>',
-                                r'href="(/uc\?export=download[^"]+)"',
-                                r'href="(https://drive\.google\.com/uc\?export=download[^"]+)"',
-                                r'action="(/uc\?export=download[^"]+)"',
-                                r'action="(https://drive\.google\.com/uc\?export=download[^"]+)"',
-                            ]
-                            
-                            for pattern in download_link_patterns:
-                                match = re.search(pattern, html_content, re.IGNORECASE)
-                                if match:
-                                    download_url_found = match.group(1)
-                                    # Clean up the URL
-                                    download_url_found = download_url_found.replace('\\x3d', '=').replace('\\/', '/')
-                                    if not download_url_found.startswith('http'):
-                                        if download_url_found.startswith('/'):
-                                            download_url_found = f"https://drive.google.com{download_url_found}"
-                                        else:
-                                            download_url_found = f"https://drive.google.com/{download_url_found}"
-                                    logger.info(f"Found download link in HTML: {download_url_found}")
-                                    break
-                        
-                        # Method 2: Look for JavaScript variables containing download URLs
-                        # Google Drive sometimes stores the download URL in JavaScript variables
-                        js_url_patterns = [
-                            r'var\s+url\s*=\s*["\']([^"\']*uc\?export=download[^"\']*)["\']',
-                            r'const\s+url\s*=\s*["\']([^"\']*uc\?export=download[^"\']*)["\']',
-                            r'href\s*[:=]\s*["\']([^"\']*uc\?export=download[^"\']*)["\']',
-                            r'downloadUrl\s*[:=]\s*["\']([^"\']*uc\?export=download[^"\']*)["\']',
-                            r'download_url\s*[:=]\s*["\']([^"\']*uc\?export=download[^"\']*)["\']',
-                        ]
-                        
-                        for pattern in js_url_patterns:
-                            match = re.search(pattern, html_content, re.IGNORECASE)
-                            if match:
-                                js_url = match.group(1)
-                                # Clean up the URL
-                                js_url = js_url.replace('\\x3d', '=').replace('\\/', '/')
-                                if not js_url.startswith('http'):
-                                    if js_url.startswith('/'):
-                                        js_url = f"https://drive.google.com{js_url}"
-                                    else:
-                                        js_url = f"https://drive.google.com/{js_url}"
-                                if not download_url_found:  # Only use if we didn't find a better one
-                                    download_url_found = js_url
-                                    logger.info(f"Found download URL in JavaScript: {download_url_found}")
+                    html_buf = bytearray(prebuffered)
+                    # Checked before each pull, so nothing is downloaded once the cap is reached
+                    if len(html_buf) < DRIVE_HTML_MAX_BYTES:
+                        async for chunk in chunks:
+                            html_buf += chunk[:DRIVE_HTML_MAX_BYTES - len(html_buf)]
+                            if len(html_buf) >= DRIVE_HTML_MAX_BYTES:
                                 break
+                    
+                    # Try to extract the download confirmation token from HTML
+                    html_content = bytes(html_buf)
+                    
+                    logger.opt(lazy=True).debug("HTML content preview: {}...", lambda: html_content[:1000].decode('utf-8', errors='ignore'))
+                    
+                    # Parse off the event loop so other downloads keep streaming
+                    extracted = await asyncio.to_thread(_parse_drive_confirmation_html, html_content)
+                    confirm_token = extracted['confirm_token']
+                    download_url_found = extracted['download_url_found']
+                    
+                    # Candidate URLs, most likely to work first
+                    candidates = []
+                    
+                    # PRIORITY: Build the working URL format FIRST: https://drive.usercontent.google.com/download
+                    if confirm_token:
+                        # Use the working URL format with all extracted parameters
+                        download_params = {
+                            'id': file_id,
+                            'export': extracted['export'],
+                            'authuser': extracted['authuser'],
+                            'confirm': confirm_token
+                        }
                         
-                        # Method 3: Extract all hidden input fields from the form (PRIORITY - this is the working format)
-                        # Google Drive uses hidden inputs for confirm, uuid, at, etc.
-                        # This method builds the working URL: https://drive.usercontent.google.com/download
-                        hidden_inputs = {}
-                        # More flexible pattern that handles different attribute orders and quoted/unquoted values
-                        hidden_input_patterns = [
-                            r'<input[^>]*type=["\']?hidden["\']?[^>]*name=["\']([^"\']+)["\'][^>]*value=["\']([^"\']+)["\']',
-                            r'<input[^>]*name=["\']([^"\']+)["\'][^>]*type=["\']?hidden["\']?[^>]*value=["\']([^"\']+)["\']',
-                            r'<input[^>]*type=["\']?hidden["\']?[^>]*name=([^\s>]+)[^>]*value=([^\s>]+)',
-                        ]
-                        
-                        for pattern in hidden_input_patterns:
-                            for match in re.finditer(pattern, html_content, re.IGNORECASE):
-                                input_name = match.group(1).strip('\'"')
-                                input_value = match.group(2).strip('\'"')
-                                if input_name not in hidden_inputs:  # Don't overwrite existing values
-                                    hidden_inputs[input_name] = input_value
-                                    logger.debug(f"Found hidden input: {input_name} = {input_value}")
-                        
-                        if hidden_inputs:
-                            logger.info(f"Extracted {len(hidden_inputs)} hidden input fields from form")
-                        
-                        # Extract specific important fields
-                        confirm_token = hidden_inputs.get('confirm') or hidden_inputs.get('t')
-                        uuid_value = hidden_inputs.get('uuid')
-                        at_value = hidden_inputs.get('at')
-                        authuser_value = hidden_inputs.get('authuser', '0')
-                        export_value = hidden_inputs.get('export', '')
-                        
-                        # Also try alternative patterns for confirm token if not found in hidden inputs
-                        if not confirm_token:
-                            token_patterns = [
-                                r'name="confirm"[^>]*value="([^"]+)"',
-                                r'var\s+uc_download_token\s*=\s*["\']([^"\']+)["\']',
-                                r'confirm=([a-zA-Z0-9_-]+)',
-                                r'confirm\\x3d([a-zA-Z0-9_-]+)',
-                                r'uc-download-link[^>]*href="[^"]*confirm=([a-zA-Z0-9_-]+)',
-                                r't\.action\s*=\s*["\']([^"\']*uc\?export=download[^"\']*)["\']',
-                            ]
-                            
-                            for pattern in token_patterns:
-                                match = re.search(pattern, html_content, re.IGNORECASE)
-                                if match:
-                                    confirm_token = match.group(1)
-                                    logger.info(f"Found confirmation token via pattern: {confirm_token}")
-                                    break
-                        
-                        # PRIORITY: Build the working URL format FIRST: https://drive.usercontent.google.com/download
-                        if file_id and confirm_token:
-                            # Use the working URL format with all extracted parameters
-                            download_params = {
-                                'id': file_id,
-                                'export': export_value,
-                                'authuser': authuser_value,
-                                'confirm': confirm_token
-                            }
-                            
-                            if uuid_value:
-                                download_params['uuid'] = uuid_value
-                            if at_value:
-                                download_params['at'] = at_value
-                            
-                            # Build URL with the working format
-                            working_url = f"https://drive.usercontent.google.com/download?{urlencode(download_params)}"
-                            logger.info(f"Built working download URL with hidden inputs: {working_url[:100]}...")
-                            
-                            if working_url not in tried_urls:
-                                logger.info(f"Trying working URL format with extracted form values (PRIORITY)")
-                                try:
-                                    return await download_video_from_url(
-                                        working_url, 
-                                        output_path, 
-                                        filename_hint, 
-                                        file_id=file_id, 
-                                        is_retry=True,
-                                        retry_count=retry_count + 1,
-                                        tried_urls=tried_urls
-                                    )
-                                except HTTPException:
-                                    pass  # Try next method
-                        
-                        # Fallback: Try the found download URL (from Method 1)
-                        if download_url_found and download_url_found not in tried_urls:
-                            logger.info(f"Retrying with found download link: {download_url_found}")
-                            try:
-                                return await download_video_from_url(
-                                    download_url_found, 
-                                    output_path, 
-                                    filename_hint, 
-                                    file_id=file_id, 
-                                    is_retry=True,
-                                    retry_count=retry_count + 1,
-                                    tried_urls=tried_urls
-                                )
-                            except HTTPException:
-                                pass  # Try next method
-                        
-                        # Try with extracted confirmation token
-                        if confirm_token and confirm_token not in ['t', 'yes']:  # Don't retry generic tokens
-                            confirm_url = f"https://drive.google.com/uc?export=download&confirm={confirm_token}&id={file_id}"
-                            if confirm_url not in tried_urls:
-                                logger.info(f"Retrying with extracted token: {confirm_url}")
-                                try:
-                                    return await download_video_from_url(
-                                        confirm_url, 
-                                        output_path, 
-                                        filename_hint, 
-                                        file_id=file_id, 
-                                        is_retry=True,
-                                        retry_count=retry_count + 1,
-                                        tried_urls=tried_urls
-                                    )
-                                except HTTPException:
-                                    pass  # Try next method
-                        
-                        # If we've exhausted retries, raise error
-                        if retry_count >= MAX_RETRIES - 1:
-                            raise HTTPException(
-                                status_code=400,
-                                detail=f"Unable to download Google Drive file after {MAX_RETRIES} attempts. The file requires manual confirmation for virus scanning or may not be publicly accessible. Please ensure the file is shared with 'Anyone with the link' permission. Alternatively, try downloading the file manually and uploading it directly."
-                            )
-                        
-                        # Last resort: Try generic confirm=t (but only once)
-                        if retry_count == 0:
-                            confirm_url = f"https://drive.google.com/uc?export=download&confirm=t&id={file_id}"
-                            if confirm_url not in tried_urls:
-                                logger.info(f"Trying generic confirm=t parameter: {confirm_url}")
-                                try:
-                                    return await download_video_from_url(
-                                        confirm_url, 
-                                        output_path, 
-                                        filename_hint, 
-                                        file_id=file_id, 
-                                        is_retry=True,
-                                        retry_count=retry_count + 1,
-                                        tried_urls=tried_urls
-                                    )
-                                except HTTPException:
-                                    pass
-                        
-                        # If all methods failed, raise error
-                        raise HTTPException(
-                            status_code=400,
-                            detail=f"Unable to download Google Drive file. The file requires manual confirmation for virus scanning or may not be publicly accessible. Please ensure the file is shared with 'Anyone with the link' permission. Maximum file size: {max_size_mb} MB."
-                        )
-                
-                # Determine file extension from Content-Type if not already set
-                if not file_extension or file_extension == ".mp4":
-                    if "video/mp4" in content_type:
-                        file_extension = ".mp4"
-                    elif "video/webm" in content_type:
-                        file_extension = ".webm"
-                    elif "video/quicktime" in content_type or "video/mov" in content_type:
-                        file_extension = ".mov"
-                    elif "video/x-msvideo" in content_type:
-                        file_extension = ".avi"
-                    elif "application/octet-stream" in content_type:
-                        # Some servers don't send proper content-type, try to detect from filename or default
-                        file_extension = file_extension or ".mp4"
-                
-                # Update output path with correct extension
-                final_output_path = output_path
-                if not output_path.endswith(file_extension):
-                    final_output_path = os.path.splitext(output_path)[0] + file_extension
-                
-                # Download with progress tracking and validation
-                total_size = 0
-                max_size_mb = _get_settings().MAX_VIDEO_SIZE_MB
-                max_size_bytes = max_size_mb * 1024 * 1024
-                first_chunk_received = False
-                first_bytes = b""
-                
-                with open(final_output_path, "wb") as f:
-                    async for chunk in response.aiter_bytes(chunk_size=8192):
-                        if not first_chunk_received:
-                            first_bytes += chunk[:min(12, len(chunk))]  # Read first 12 bytes for magic number check
-                            first_chunk_received = True
-                        
-                        total_size += len(chunk)
-                        
-                        # Check size during download
-                        if total_size > max_size_bytes:
-                            # Clean up partial download
-                            try:
-                                os.remove(final_output_path)
-                            except:
-                                pass
-                            raise HTTPException(
-                                status_code=400,
-                                detail=f"Video file size exceeds maximum allowed size ({max_size_mb} MB)"
-                            )
+                        if extracted['uuid']:
+                            download_params['uuid'] = extracted['uuid']
+                        if extracted['at']:
+                            download_params['at'] = extracted['at']
                         
-                        f.write(chunk)
-                
-                file_size_mb = total_size / (1024 * 1024)
-                logger.info(f"Video downloaded: {final_output_path} (Size: {file_size_mb:.2f} MB)")
-                
-                # Validate the downloaded file is actually a video file
-                if not _is_valid_video_file(final_output_path, first_bytes):
-                    try:
-                        os.remove(final_output_path)
-                    except:
-                        pass
-                    raise HTTPException(
-                        status_code=400,
-                        detail="The downloaded file is not a valid video file. The URL may have returned HTML or a corrupted file. Please verify the URL points directly to a video file."
-                    )
-                
-                logger.info(f"Video file validated successfully: {final_output_path}")
-                return final_output_path, file_size_mb
+                        # Build URL with the working format
+                        working_url = f"https://drive.usercontent.google.com/download?{urlencode(download_params)}"
+                        logger.opt(lazy=True).info("Built working download URL with hidden inputs: {}...", lambda: working_url[:100])
+                        candidates.append(working_url)
+                    
+                    # Fallback: Try the found download URL (from Method 1)
+                    if download_url_found:
+                        candidates.append(download_url_found)
+                    
+                    # Try with extracted confirmation token
+                    if confirm_token and confirm_token not in ['t', 'yes']:  # Don't retry generic tokens
+                        candidates.append(f"https://drive.google.com/uc?export=download&confirm={confirm_token}&id={file_id}")
+                    
+                    # Last resort: Try generic confirm=t (but only once)
+                    if retry_count == 0:
+                        candidates.append(f"https://drive.google.com/uc?export=download&confirm=t&id={file_id}")
+                    
+                    raise _RetryWithUrls(candidates)
+            
+            return await _save_video_stream(
+                _prepend_chunk(prebuffered, chunks),
+                output_path,
+                file_extension,
+                mime_type,
+                max_size_mb,
+                response.headers.get("content-length")
+            )
         
     except httpx.HTTPStatusError as e:
         status_code = e.response.status_code
@@ -709,7 +812,7 @@ async def download_video_from_url(url: str, output_path: str, filename_hint: str
             status_code=503,
             detail=f"Network error while downloading video: {str(e)}. Please check your internet connection."
         )
-    except HTTPException:
+    except (HTTPException, _RetryWithUrls):
         raise
     except Exception as e:
         logger.error(f"Error downloading video from URL: {e}", exc_info=True)
@@ -719,16 +822,257 @@ async def download_video_from_url(url: str, output_path: str, filename_hint: str
         )
 
 
+async def download_video_from_url(url: str, output_path: str, client: httpx.AsyncClient, filename_hint: str = None) -> Tuple[str, float]:
+    """
+    Download video from URL (supports Google Drive, Loom, and generic URLs)
+    
+    Google Drive confirmation pages are retried in a loop: each page yields an
+    ordered list of candidate URLs, tried depth-first until one returns the file.
+    
+    Args:
+        url: Video URL to download
+        output_path: Path to save the downloaded video
+        client: HTTP client for this download (see _download_client)
+        filename_hint: Optional filename hint for file extension detection
+    
+    Returns:
+        Tuple of (downloaded_file_path, file_size_mb)
+    
+    Raises:
+        HTTPException: For various error conditions with appropriate status codes
+    """
+    # Read the size limit once so the whole request sees one configuration
+    settings = _get_settings()
+    max_size_mb = settings.MAX_VIDEO_SIZE_MB
+    
+    # Validate URL format
+    parsed_url = urlparse(url)
+    if not parsed_url.scheme or not parsed_url.netloc:
+        raise HTTPException(
+            status_code=400,
+            detail="Invalid URL format. Please provide a valid URL."
+        )
+    
+    # Handle Google Drive links
+    file_id = None
+    if "drive.google.com" in url.lower():
+        logger.info("Detected Google Drive link, converting to direct download URL")
+        # Convert Google Drive share link to direct download link
+        file_id = _extract_drive_file_id(url)
+        if file_id:
+            download_url = f"https://drive.google.com/uc?export=download&id={file_id}"
+            url = download_url
+        else:
+            # Also try to extract from confirm URLs
+            file_id_match = _DRIVE_QUERY_ID_RE.search(url)
+            if file_id_match:
+                file_id = file_id_match.group(1)
+                # Already a download URL, use as is
+            else:
+                raise HTTPException(
+                    status_code=400,
+                    detail="Invalid Google Drive URL. Please provide a shareable Google Drive link."
+                )
+    
+    # Handle Loom links
+    elif "loom.com" in url.lower() or "loom.share" in url.lower():
+        logger.info("Detected Loom link, attempting to extract video URL")
+        # Loom videos can be accessed via their API or direct video URL
+        # For public videos, we can try to get the video URL
+        # This might require the loom.com/share format
+        if "/share/" in url:
+            # Extract the video ID from Loom URL
+            loom_id_match = _LOOM_SHARE_ID_RE.search(url)
+            if loom_id_match:
+                loom_id = loom_id_match.group(1)
+                # Try to get the video URL (Loom might require different approach)
+                # For now, try the direct video URL format
+                url = f"https://cdn.loom.com/sessions/videos/{loom_id}/transcoded.mp4"
+                logger.info("Converted Loom URL to: {}", url)
+    
+    # Determine file extension from filename hint or Content-Type header
+    file_extension = None
+    if filename_hint:
+        file_extension = os.path.splitext(filename_hint)[1].lower()
+    
+    timeout = _download_timeout(max_size_mb)
+    
+    # Prevent infinite loops - confirmation pages are followed at most 3 levels deep
+    MAX_CONFIRM_DEPTH = 3
+    # Network failures are retried with exponential backoff, at most 4 times per download
+    MAX_RETRIES = 4
+    
+    # Stack of (url, retry_count); candidates are pushed in reverse so the
+    # highest-priority one is tried (with its own retries) first
+    pending = [(url, 0)]
+    # Only fingerprints are kept: Drive URLs are long and a retry chain only
+    # needs to know whether an equivalent attempt was already made
+    tried_keys: set[int] = set()
+    network_retries = 0
+    while pending:
+        attempt_url, retry_count = pending.pop()
+        
+        # Skip requests we've already made (same file_id/confirm/uuid/at)
+        attempt_key = hash(_attempt_key(attempt_url, file_id))
+        if attempt_key in tried_keys:
+            continue
+        tried_keys.add(attempt_key)
+        
+        try:
+            return await _download_attempt(
+                attempt_url,
+                output_path,
+                client,
+                file_extension,
+                file_id,
+                retry_count,
+                max_size_mb,
+                timeout
+            )
+        except _RetryWithUrls as e:
+            logger.warning(f"Received HTML from Google Drive (confirmation page, attempt {retry_count + 1}/{MAX_CONFIRM_DEPTH})")
+            if retry_count + 1 < MAX_CONFIRM_DEPTH:
+                pending.extend((candidate, retry_count + 1) for candidate in reversed(e.urls))
+        except HTTPException as e:
+            # Connection/network failure (mapped to 503): back off, then retry the same URL
+            # rather than immediately hammering the host again
+            if e.status_code == 503 and network_retries < MAX_RETRIES:
+                delay = min(30.0, 0.5 * 2 ** network_retries)
+                network_retries += 1
+                logger.warning(f"Network error downloading video, retrying in {delay:.1f}s ({network_retries}/{MAX_RETRIES})")
+                await asyncio.sleep(delay)
+                tried_keys.discard(attempt_key)
+                pending.append((attempt_url, retry_count))
+                continue
+            # The original URL's errors (404, 403, too large, ...) go straight to the client;
+            # a failed candidate just moves on to the next one
+            if retry_count == 0:
+                raise
+    
+    # If all methods failed, raise error
+    raise HTTPException(
+        status_code=400,
+        detail=f"Unable to download Google Drive file. The file requires manual confirmation for virus scanning or may not be publicly accessible. Please ensure the file is shared with 'Anyone with the link' permission. Maximum file size: {max_size_mb} MB."
+    )
+
+
+async def _save_upload(file: UploadFile, output_path: str, max_size_mb: int) -> int:
+    """
+    Copy an uploaded file to disk in DOWNLOAD_CHUNK_SIZE pieces, enforcing the size limit
+    
+    Returns:
+        Number of bytes written
+    """
+    max_size_bytes = max_size_mb << 20
+    total_size = 0
+    # The multipart part size is known up front; preallocate unless it's over the limit
+    size_hint = file.size if file.size and file.size <= max_size_bytes else None
+    async with AsyncFileWriter(output_path, size_hint=size_hint) as buffer:
+        while chunk := await file.read(DOWNLOAD_CHUNK_SIZE):
+            total_size += len(chunk)
+            if total_size > max_size_bytes:
+                raise HTTPException(
+                    status_code=400,
+                    detail=f"File size exceeds maximum allowed size ({max_size_mb} MB)"
+                )
+            await buffer.write(chunk)
+    return total_size
+
+
+async def _analyze_single_url(
+    app: FastAPI,
+    video_url: str,
+    filename_hint: Optional[str] = None
+) -> VideoAnalysisResponse:
+    """
+    Download a video from a URL and run the analysis pipeline on it
+    
+    Shared by the single and batch URL endpoints; every failure surfaces as
+    an HTTPException.
+    """
+    start_time = time.time()
+    temp_video_path = None
+    temp_dir = None
+    
+    try:
+        # Validate URL
+        if not video_url or not video_url.strip():
+            raise HTTPException(
+                status_code=400,
+                detail="Video URL is required. Please provide a valid video URL."
+            )
+        
+        url = video_url.strip()
+        logger.info(f"Processing video URL: {url}")
+        
+        # Check that the shared analyzer is available (Gemini API key configured)
+        analyzer = _require_analyzer(app)
+        
+        # Create temporary directory for video download
+        temp_dir = tempfile.mkdtemp()
+        logger.info(f"Created temporary directory: {temp_dir}")
+        temp_video_base_path = os.path.join(temp_dir, "downloaded_video")
+        
+        # Download video from URL
+        try:
+            async with _download_client(app.state.http_pool) as client:
+                temp_video_path, file_size_mb = await download_video_from_url(
+                    url,
+                    temp_video_base_path,
+                    client,
+                    filename_hint=filename_hint
+                )
+            logger.info(f"Video downloaded: {temp_video_path} (Size: {file_size_mb:.2f} MB)")
+        except HTTPException:
+            raise
+        except Exception as e:
+            logger.error(f"Error downloading video: {e}", exc_info=True)
+            raise HTTPException(status_code=500, detail=f"Failed to download video from URL: {str(e)}")
+        
+        # Validate file extension after download
+        file_extension = os.path.splitext(temp_video_path)[1].lower()
+        
+        if file_extension not in _ALLOWED_VIDEO_EXT:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Unsupported video format: {file_extension}. Allowed formats: {_ALLOWED_VIDEO_EXT_LIST}"
+            )
+        
+        # Process video
+        logger.info("Starting video analysis pipeline...")
+        try:
+            async with _analysis_sem:
+                result = await analyzer.process_video(temp_video_path)
+        except Exception as e:
+            logger.error(f"Error processing video: {e}", exc_info=True)
+            raise HTTPException(status_code=500, detail=f"Failed to process video: {str(e)}")
+        
+        processing_time = time.time() - start_time
+        logger.info(f"Video analysis completed in {processing_time:.2f} seconds")
+        
+        # Build response (the transcript, if present, is included as-is)
+        return _build_analysis_response(result, processing_time)
+    
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error analyzing video from URL: {e}", exc_info=True)
+        raise HTTPException(status_code=500, detail=f"Failed to analyze video from URL: {str(e)}")
+    
+    finally:
+        # Clean up temp directory along with the video and any partial downloads
+        if temp_dir and os.path.exists(temp_dir):
+            shutil.rmtree(temp_dir, ignore_errors=True)
+            logger.info("Temporary files cleaned up")
+
+
 def setup_routes(app: FastAPI):
     """Setup API routes"""
     
     @app.get("/", response_model=BaseResponse)
     async def root():
         """Root endpoint"""
-        return BaseResponse(
-            message="AI Service is running",
-            timestamp=datetime.now()
-        )
+        return BaseResponse(message="AI Service is running")
     
     @app.get("/health", response_model=HealthCheckResponse)
     async def health_check():
@@ -743,82 +1087,43 @@ def setup_routes(app: FastAPI):
         """AI Interview Video Analyzer - accepts file upload"""
         start_time = time.time()
         temp_video_path = None
+        temp_dir = None
         
         try:
             # Validate file type
             logger.info(f"Validating file type: {file.filename}")
-            allowed_extensions = {'.mp4', '.mov', '.avi', '.mkv', '.webm', '.flv', '.wmv', '.m4v'}
             file_extension = os.path.splitext(file.filename)[1].lower()
             
-            if file_extension not in allowed_extensions:
+            if file_extension not in _ALLOWED_VIDEO_EXT:
                 raise HTTPException(
                     status_code=400,
-                    detail=f"Unsupported file format. Allowed formats: {', '.join(allowed_extensions)}"
+                    detail=f"Unsupported file format. Allowed formats: {_ALLOWED_VIDEO_EXT_LIST}"
                 )
             
-            # Check file size
-            file_content = await file.read()
-            file_size_mb = len(file_content) / (1024 * 1024)
-            settings = _get_settings()
-            max_size_mb = settings.MAX_VIDEO_SIZE_MB
-            
-            if file_size_mb > max_size_mb:
-                raise HTTPException(
-                    status_code=400,
-                    detail=f"File size ({file_size_mb:.2f} MB) exceeds maximum allowed size ({max_size_mb} MB)"
-                )
+            max_size_mb = _get_settings().MAX_VIDEO_SIZE_MB
             
-            # Check if Gemini API key is configured
-            if not settings.GEMINI_API_KEY:
-                raise HTTPException(
-                    status_code=500,
-                    detail="GEMINI_API_KEY is not configured. Please set it in your .env file."
-                )
+            # Check that the shared analyzer is available (Gemini API key configured)
+            analyzer = _require_analyzer(app)
             
             # Save uploaded file temporarily
             temp_dir = tempfile.mkdtemp()
             logger.info(f"Created temporary directory: {temp_dir}")
             temp_video_path = os.path.join(temp_dir, f"uploaded_video{file_extension}")
             logger.info(f"Created temporary video path: {temp_video_path}")
-            with open(temp_video_path, "wb") as buffer:
-                buffer.write(file_content)
             
-            # Initialize video analyzer
-            analyzer = VideoAnalyzer(
-                gemini_api_key=settings.GEMINI_API_KEY,
-                whisper_model=settings.WHISPER_MODEL,
-                use_alternative_transcription=getattr(settings, 'USE_ALTERNATIVE_TRANSCRIPTION', False),
-                transcription_service=getattr(settings, 'TRANSCRIPTION_SERVICE', 'whisper'),
-                transcription_api_key=getattr(settings, 'TRANSCRIPTION_API_KEY', None)
-            )
+            # Stream the upload to disk, checking the size as it goes
+            file_size_bytes = await _save_upload(file, temp_video_path, max_size_mb)
+            logger.info(f"Saved upload: {temp_video_path} (Size: {file_size_bytes / (1024 * 1024):.2f} MB)")
             
             # Process video
-            result = analyzer.process_video(temp_video_path)
+            async with _analysis_sem:
+                result = await analyzer.process_video(temp_video_path)
             
             processing_time = time.time() - start_time
             logger.info(f"Video analysis completed in {processing_time:.2f} seconds")
             
-            # Extract transcript if present (optional for response)
-            transcript = result.pop("transcript", None)
-            
-            # Build response
-            response = VideoAnalysisResponse(
-                is_interview=result.get("is_interview", True),
-                summary=result.get("summary", ""),
-                key_questions=result.get("key_questions", []),
-                tone_and_professionalism=result.get("tone_and_professionalism", ""),
-                rating=float(result.get("rating", 0)),
-                technical_strengths=result.get("technical_strengths", []),
-                technical_weaknesses=result.get("technical_weaknesses", []),
-                communication_rating=float(result.get("communication_rating", 0)),
-                technical_knowledge_rating=float(result.get("technical_knowledge_rating", 0)),
-                follow_up_questions=result.get("follow_up_questions", []),
-                interviewer_review=result.get("interviewer_review", "Interviewer review not available"),
-                transcript=transcript,
-                processing_time=processing_time
-            )
-            
-            return response
+            # Build response (the transcript, if present, is included as-is)
+            return _build_analysis_response(result, processing_time)
         
         except HTTPException:
             raise
@@ -827,136 +1132,61 @@ def setup_routes(app: FastAPI):
             raise HTTPException(status_code=500, detail=f"Failed to analyze video: {str(e)}")
         
         finally:
-            # Cleanup temporary file
-            if temp_video_path and os.path.exists(temp_video_path):
-                try:
-                    os.remove(temp_video_path)
-                    os.rmdir(os.path.dirname(temp_video_path))
-                except Exception as e:
-                    logger.warning(f"Failed to cleanup temp file: {e}")
+            # Cleanup temporary directory (and the upload inside it)
+            if temp_dir and os.path.exists(temp_dir):
+                shutil.rmtree(temp_dir, ignore_errors=True)
     
     @app.post("/analyze-video-url", response_model=VideoAnalysisResponse)
     async def analyze_video_url(request: VideoUrlRequest):
         """AI Interview Video Analyzer from URL"""
+        return await _analyze_single_url(app, request.video_url, request.filename)
+    
+    @app.post("/analyze-videos-url", response_model=BatchVideoAnalysisResponse)
+    async def analyze_videos_url(request: BatchVideoUrlRequest):
+        """AI Interview Video Analyzer for several URLs at once"""
         start_time = time.time()
-        temp_video_path = None
-        temp_dir = None
         
-        try:
-            # Validate URL
-            if not request.video_url or not request.video_url.strip():
-                raise HTTPException(
-                    status_code=400,
-                    detail="Video URL is required. Please provide a valid video URL."
-                )
-            
-            url = request.video_url.strip()
-            logger.info(f"Processing video URL: {url}")
-            
-            # Check if Gemini API key is configured
-            settings = _get_settings()
-            if not settings.GEMINI_API_KEY:
-                raise HTTPException(
-                    status_code=500,
-                    detail="GEMINI_API_KEY is not configured. Please set it in your .env file."
-                )
-            
-            # Create temporary directory for video download
-            temp_dir = tempfile.mkdtemp()
-            logger.info(f"Created temporary directory: {temp_dir}")
-            temp_video_base_path = os.path.join(temp_dir, "downloaded_video")
-            
-            # Download video from URL
-            try:
-                temp_video_path, file_size_mb = await download_video_from_url(
-                    url,
-                    temp_video_base_path,
-                    filename_hint=request.filename
-                )
-                logger.info(f"Video downloaded: {temp_video_path} (Size: {file_size_mb:.2f} MB)")
-            except HTTPException:
-                raise
-            except Exception as e:
-                logger.error(f"Error downloading video: {e}", exc_info=True)
-                raise HTTPException(status_code=500, detail=f"Failed to download video from URL: {str(e)}")
-            
-            # Validate file extension after download
-            file_extension = os.path.splitext(temp_video_path)[1].lower()
-            allowed_extensions = {'.mp4', '.mov', '.avi', '.mkv', '.webm', '.flv', '.wmv', '.m4v'}
-            
-            if file_extension not in allowed_extensions:
-                raise HTTPException(
-                    status_code=400,
-                    detail=f"Unsupported video format: {file_extension}. Allowed formats: {', '.join(allowed_extensions)}"
-                )
-            
-            # Initialize video analyzer
-            analyzer = VideoAnalyzer(
-                gemini_api_key=settings.GEMINI_API_KEY,
-                whisper_model=settings.WHISPER_MODEL,
-                use_alternative_transcription=getattr(settings, 'USE_ALTERNATIVE_TRANSCRIPTION', False),
-                transcription_service=getattr(settings, 'TRANSCRIPTION_SERVICE', 'whisper'),
-                transcription_api_key=getattr(settings, 'TRANSCRIPTION_API_KEY', None)
+        if not request.video_urls:
+            raise HTTPException(
+                status_code=400,
+                detail="At least one video URL is required."
             )
-            
-            # Process video
-            logger.info("Starting video analysis pipeline...")
-            try:
-                result = analyzer.process_video(temp_video_path)
-            except Exception as e:
-                logger.error(f"Error processing video: {e}", exc_info=True)
-                raise HTTPException(status_code=500, detail=f"Failed to process video: {str(e)}")
-            
-            processing_time = time.time() - start_time
-            logger.info(f"Video analysis completed in {processing_time:.2f} seconds")
-            
-            # Extract transcript if present (optional for response)
-            transcript = result.pop("transcript", None)
-            
-            # Build response
-            response = VideoAnalysisResponse(
-                is_interview=result.get("is_interview", True),
-                summary=result.get("summary", ""),
-                key_questions=result.get("key_questions", []),
-                tone_and_professionalism=result.get("tone_and_professionalism", ""),
-                rating=float(result.get("rating", 0)),
-                technical_strengths=result.get("technical_strengths", []),
-                technical_weaknesses=result.get("technical_weaknesses", []),
-                communication_rating=float(result.get("communication_rating", 0)),
-                technical_knowledge_rating=float(result.get("technical_knowledge_rating", 0)),
-                follow_up_questions=result.get("follow_up_questions", []),
-                interviewer_review=result.get("interviewer_review", "Interviewer review not available"),
-                transcript=transcript,
-                processing_time=processing_time
+        if len(request.video_urls) > MAX_BATCH_URLS:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Too many video URLs. At most {MAX_BATCH_URLS} can be analyzed per request."
             )
-            
-            return response
         
-        except HTTPException:
-            raise
-        except Exception as e:
-            logger.error(f"Error analyzing video from URL: {e}", exc_info=True)
-            raise HTTPException(status_code=500, detail=f"Failed to analyze video from URL: {str(e)}")
+        # Fail the whole batch up front if analysis isn't possible at all
+        _require_analyzer(app)
         
-        finally:
-            # Cleanup temporary file and directory
-            if temp_video_path and os.path.exists(temp_video_path):
-                try:
-                    os.remove(temp_video_path)
-                except Exception as e:
-                    logger.warning(f"Failed to remove temp video file: {e}")
-            
-            # Clean up temp directory
-            if temp_dir and os.path.exists(temp_dir):
+        # Downloads overlap their network waits; the analyses themselves are
+        # still bounded by _analysis_sem
+        batch_sem = asyncio.Semaphore(BATCH_URL_CONCURRENCY)
+        
+        async def analyze_one(url: str) -> BatchVideoAnalysisItem:
+            async with batch_sem:
                 try:
-                    # Remove any remaining files in the directory
-                    for file in os.listdir(temp_dir):
-                        try:
-                            os.remove(os.path.join(temp_dir, file))
-                        except:
-                            pass
-                    os.rmdir(temp_dir)
-                    logger.info("Temporary files cleaned up")
-                except Exception as e:
-                    logger.warning(f"Failed to cleanup temp directory: {e}")
-
+                    result = await _analyze_single_url(app, url)
+                except HTTPException as e:
+                    return BatchVideoAnalysisItem(
+                        video_url=url,
+                        success=False,
+                        status_code=e.status_code,
+                        error=str(e.detail)
+                    )
+                return BatchVideoAnalysisItem(video_url=url, success=True, result=result)
+        
+        # One URL failing doesn't affect the others; each reports its own outcome
+        results = await asyncio.gather(*(analyze_one(url) for url in request.video_urls))
+        
+        succeeded = sum(1 for item in results if item.success)
+        processing_time = time.time() - start_time
+        logger.info(f"Batch analysis completed in {processing_time:.2f} seconds ({succeeded}/{len(results)} succeeded)")
+        
+        return BatchVideoAnalysisResponse(
+            results=results,
+            succeeded=succeeded,
+            failed=len(results) - succeeded,
+            processing_time=processing_time
+        )
@@ -0,0 +1,76 @@
+"""
+Analysis Cache - content-addressed on-disk store for Gemini analyses
+"""
+import hashlib
+import os
+import tempfile
+from typing import Any, Dict, Optional
+
+import orjson
+from loguru import logger
+
+
+class AnalysisCache:
+    """
+    Cache analysis results on local disk, keyed by a hash of their input
+
+    Each entry is one small JSON file named after the key. Writes go to a
+    temporary file first and are renamed into place, so concurrent readers
+    never see a partial entry. Any I/O problem is treated as a miss.
+
+    Usage:
+        cache = AnalysisCache("/tmp/interview-analyses")
+        key = AnalysisCache.make_key(prompt_version, transcript)
+        analysis = cache.get(key)
+        if analysis is None:
+            analysis = ...
+            cache.set(key, analysis)
+    """
+
+    def __init__(self, directory: str):
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+
+    @staticmethod
+    def make_key(*parts: str) -> str:
+        """SHA-256 over the parts, each length-prefixed so boundaries can't collide"""
+        digest = hashlib.sha256()
+        for part in parts:
+            data = part.encode("utf-8")
+            digest.update(len(data).to_bytes(8, "little"))
+            digest.update(data)
+        return digest.hexdigest()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, f"{key}.json")
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return the cached entry, or None on a miss"""
+        try:
+            with open(self._path(key), "rb") as f:
+                return orjson.loads(f.read())
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable analysis cache entry {key}: {e}")
+            return None
+
+    def set(self, key: str, value: Dict[str, Any]) -> None:
+        """Store an entry atomically; failures are logged, never raised"""
+        tmp_path = None
+        try:
+            # Serialized first: orjson.JSONEncodeError (a TypeError) leaves no temp file
+            data = orjson.dumps(value)
+            # The directory may have been removed since startup (e.g. a tmp cleaner)
+            os.makedirs(self.directory, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, self._path(key))
+        except (OSError, TypeError) as e:
+            logger.warning(f"Failed to write analysis cache entry {key}: {e}")
+            if tmp_path is not None:
+                try:
+                    os.remove(tmp_path)
+                except OSError:
+                    pass
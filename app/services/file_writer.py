@@ -0,0 +1,151 @@
+"""
+Async File Writer - pipelined disk writes for streamed downloads
+"""
+import asyncio
+import os
+from typing import List, Optional
+
+
+# pwrite() lets several writes be in flight at explicit offsets; without it
+# (Windows) writes are issued one at a time through lseek + write
+_HAS_PWRITE = hasattr(os, "pwrite")
+
+# Linux/BSD only; elsewhere the file simply grows as it is written
+_HAS_FALLOCATE = hasattr(os, "posix_fallocate")
+_HAS_FADVISE = hasattr(os, "posix_fadvise")
+
+
+def _pwrite_all(fd: int, data: bytes, offset: int) -> None:
+    """Write all of data at offset, retrying short writes"""
+    view = memoryview(data)
+    while view:
+        written = os.pwrite(fd, view, offset)
+        view = view[written:]
+        offset += written
+
+
+def _write_all_at(fd: int, data: bytes, offset: int) -> None:
+    """Sequential fallback for platforms without pwrite()"""
+    os.lseek(fd, offset, os.SEEK_SET)
+    view = memoryview(data)
+    while view:
+        written = os.write(fd, view)
+        view = view[written:]
+
+
+class AsyncFileWriter:
+    """
+    Write a file from async code without waiting on each chunk
+
+    Each write is submitted to the default executor at its own offset and
+    the caller only waits once `max_pending` writes are outstanding, so the
+    next network chunk can be received while earlier ones reach the disk.
+    Chunks smaller than `coalesce_size` are buffered and submitted together,
+    so short network reads don't each cost an executor round trip.
+    
+    When `size_hint` (the expected length) is given the file is preallocated
+    up front and trimmed to the bytes actually written on close.
+
+    Usage:
+        async with AsyncFileWriter(path) as f:
+            async for chunk in response_chunks:
+                await f.write(chunk)
+    """
+
+    def __init__(
+        self,
+        path: str,
+        max_pending: int = 4,
+        coalesce_size: int = 1024 * 1024,
+        size_hint: Optional[int] = None
+    ):
+        self.path = path
+        self.size_hint = size_hint
+        self.max_pending = max_pending if _HAS_PWRITE else 1
+        self.coalesce_size = coalesce_size
+        self.fd = None
+        self.offset = 0
+        self._buffer = bytearray()
+        self._preallocated = False
+        self._pending: List[asyncio.Future] = []
+
+    async def __aenter__(self) -> "AsyncFileWriter":
+        flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+        self.fd = os.open(self.path, flags, 0o644)
+        if (self.size_hint and _HAS_FALLOCATE) or _HAS_FADVISE:
+            # fallocate of a multi-GB hint can take a while (some filesystems
+            # emulate it by writing zeros), so keep it off the event loop
+            loop = asyncio.get_running_loop()
+            prepared = loop.run_in_executor(None, self._prepare_fd)
+            try:
+                await asyncio.shield(prepared)
+            except BaseException:
+                # The executor call can't be cancelled; let it finish before
+                # the descriptor is closed
+                await asyncio.wait([prepared])
+                os.close(self.fd)
+                self.fd = None
+                raise
+        return self
+    
+    def _prepare_fd(self) -> None:
+        """Preallocate and set access hints on the new file (runs in the executor)"""
+        if self.size_hint and _HAS_FALLOCATE:
+            # Reserve the extents in one go instead of growing the file chunk by chunk
+            try:
+                os.posix_fallocate(self.fd, 0, self.size_hint)
+                self._preallocated = True
+            except OSError:
+                pass  # Unsupported filesystem or no space yet; writes report real errors
+        if _HAS_FADVISE:
+            # Written once, front to back: let the kernel write back and drop pages early
+            os.posix_fadvise(self.fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        try:
+            # Writes already handed to the executor can't be cancelled; let
+            # them finish before the descriptor is closed
+            if exc_type is None:
+                await self.flush()
+            else:
+                await asyncio.gather(*self._pending, return_exceptions=True)
+                self._pending.clear()
+        finally:
+            if self._preallocated:
+                # Drop any reserved space past what was actually written
+                os.ftruncate(self.fd, self.offset)
+            os.close(self.fd)
+            self.fd = None
+
+    async def write(self, data: bytes) -> None:
+        """Queue data at the current end of file, waiting only if the pipeline is full"""
+        if not self._buffer and len(data) >= self.coalesce_size:
+            # Already large enough: submit as-is, without copying into the buffer
+            await self._submit(data)
+            return
+
+        self._buffer.extend(data)
+        if len(self._buffer) >= self.coalesce_size:
+            data, self._buffer = bytes(self._buffer), bytearray()
+            await self._submit(data)
+
+    async def _submit(self, data: bytes) -> None:
+        loop = asyncio.get_running_loop()
+        write_fn = _pwrite_all if _HAS_PWRITE else _write_all_at
+        self._pending.append(loop.run_in_executor(None, write_fn, self.fd, data, self.offset))
+        self.offset += len(data)
+
+        if len(self._pending) >= self.max_pending:
+            # Oldest write first; surfaces I/O errors in submission order
+            await self._pending.pop(0)
+
+    async def flush(self) -> None:
+        """Write out any buffered data and wait for every queued write to complete"""
+        if self._buffer:
+            data, self._buffer = bytes(self._buffer), bytearray()
+            await self._submit(data)
+        pending, self._pending = self._pending, []
+        results = await asyncio.gather(*pending, return_exceptions=True)
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
@@ -1,13 +1,21 @@
 """
 Main Service - Video Analyzer and AI Models
 """
+import asyncio
+import functools
 import os
-import json
-import tempfile
+import shutil
 import subprocess
+import tempfile
+import threading
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional, Tuple, Union
 from loguru import logger
+import orjson
+# pydantic (which the SDK uses to build response schemas) needs this TypedDict before Python 3.12
+from typing_extensions import TypedDict
+
+from app.services.analysis_cache import AnalysisCache
 
 # Try to import dependencies with helpful error messages
 try:
@@ -18,20 +26,56 @@ except ImportError:
         "Install it with: pip install google-generativeai"
     )
 
+# faster-whisper (CTranslate2 int8/float16 kernels) - Optional, preferred for local transcription
+try:
+    import ctranslate2
+    from faster_whisper import WhisperModel
+    FASTER_WHISPER_AVAILABLE = True
+except ImportError:
+    FASTER_WHISPER_AVAILABLE = False
+
+# Batched pipeline (faster-whisper >= 1.1): Silero VAD splits the audio into
+# speech chunks of up to 30 s, which are then encoded/decoded in batches
+try:
+    from faster_whisper import BatchedInferencePipeline
+except ImportError:
+    BatchedInferencePipeline = None
+
+# Speech chunks per batched Whisper forward pass
+WHISPER_BATCH_SIZE = 8
+
 # Whisper - Optional with fallback
 try:
+    import torch
     import whisper
     WHISPER_AVAILABLE = True
 except ImportError:
     WHISPER_AVAILABLE = False
+
+LOCAL_TRANSCRIPTION_AVAILABLE = FASTER_WHISPER_AVAILABLE or WHISPER_AVAILABLE
+if not LOCAL_TRANSCRIPTION_AVAILABLE:
     logger.warning(
-        "openai-whisper is not available. "
+        "Neither faster-whisper nor openai-whisper is available. "
         "Local transcription will be disabled. "
-        "Install with: pip install openai-whisper (requires Python 3.10-3.13)"
+        "Install with: pip install faster-whisper (or openai-whisper, requires Python 3.10-3.13)"
     )
 
-# AI Models imports
-from typing import Dict, Any
+# PyAV (libav bindings) - Optional, decodes audio in-process without an ffmpeg subprocess
+try:
+    import av
+    PYAV_AVAILABLE = True
+except ImportError:
+    PYAV_AVAILABLE = False
+
+# soxr (SIMD resampler) - Optional, resamples PyAV-decoded audio to 16 kHz
+try:
+    import soxr
+    SOXR_AVAILABLE = True
+except ImportError:
+    SOXR_AVAILABLE = False
+
+# Looked up once on PATH instead of spawning `ffmpeg -version` for every video
+FFMPEG_AVAILABLE = shutil.which("ffmpeg") is not None
 
 
 # ==================== Alternative Transcription Services ====================
@@ -194,6 +238,257 @@ def get_model(model_name: str = "default") -> AIModel:
     return model_registry.get_model(model_name)
 
 
+# ==================== Gemini ====================
+# Bump whenever the analysis prompt or output format changes, so cached
+# analyses produced by the old prompt are no longer served
+PROMPT_VERSION = "2"
+
+# Static parts of the analysis prompt, built once; only the transcript between
+# them changes per request. Changing either means bumping PROMPT_VERSION.
+_PROMPT_PREFIX = """Analyze the following interview transcript and provide a detailed analysis in JSON format.
+
+Transcript:
+"""
+
+_PROMPT_SUFFIX = """
+
+Please provide your analysis in the following JSON structure:
+{
+    "is_interview": true/false,
+    "summary": "Concise summary of the discussion",
+    "key_questions": ["Question 1", "Question 2", ...],
+    "tone_and_professionalism": "Description of tone and professionalism",
+    "rating": 0-10,
+    "technical_strengths": ["Strength 1", "Strength 2", ...],
+    "technical_weaknesses": ["Weakness 1", "Weakness 2", ...],
+    "communication_rating": 0-10,
+    "technical_knowledge_rating": 0-10,
+    "follow_up_questions": ["Question 1", "Question 2", ...],
+    "interviewer_review": "Review and evaluation of the INTERVIEWER's performance: Assess how well the interviewer conducted the interview. Evaluate the quality of questions asked, questioning techniques (open-ended vs closed, leading questions, clarity), interviewer's communication style, ability to probe deeper, active listening skills, professionalism, whether they covered all necessary topics, fairness in their approach, and overall interviewing effectiveness. This should focus on the interviewer's skills and conduct, NOT the candidate's performance."
+}
+
+Focus on:
+- React.js, Node.js, and general software engineering knowledge
+- Technical communication skills
+- Problem-solving approach
+- Code quality discussions
+- System design understanding
+
+Return only valid JSON, no additional text or markdown formatting."""
+
+
+class InterviewAnalysis(TypedDict):
+    """Shape of the analysis Gemini is constrained to return (see VideoAnalysisResponse)"""
+    is_interview: bool
+    summary: str
+    key_questions: List[str]
+    tone_and_professionalism: str
+    rating: float
+    technical_strengths: List[str]
+    technical_weaknesses: List[str]
+    communication_rating: float
+    technical_knowledge_rating: float
+    follow_up_questions: List[str]
+    interviewer_review: str
+
+
+# JSON mode with a schema: the reply is bare JSON of this shape, without
+# markdown fences or surrounding prose
+_ANALYSIS_GENERATION_CONFIG = genai.GenerationConfig(
+    response_mime_type="application/json",
+    response_schema=InterviewAnalysis
+)
+
+
+@functools.lru_cache(maxsize=1)
+def _available_gemini_models() -> Tuple[str, ...]:
+    """
+    Names of the Gemini models that support generateContent, listed once per process
+    
+    Raises if listing fails; lru_cache doesn't store exceptions, so the next
+    call lists again.
+    """
+    available_models = []
+    for model in genai.list_models():
+        if 'generateContent' in model.supported_generation_methods:
+            model_name = model.name.replace('models/', '')
+            available_models.append(model_name)
+            logger.info(f"Found available model: {model_name}")
+    return tuple(available_models)
+
+
+class _JsonObjectScanner:
+    """
+    Track brace depth over streamed text to spot where the root JSON object closes
+    
+    Braces inside JSON strings (escapes included) are ignored, as is any
+    text before the first "{" such as a markdown fence.
+    """
+    
+    def __init__(self):
+        self.depth = 0
+        self.started = False
+        self.in_string = False
+        self.escape = False
+        self.consumed = 0
+    
+    def feed(self, text: str) -> int:
+        """Return the end offset of the root object within all text fed so far, or -1"""
+        for i, ch in enumerate(text):
+            if self.in_string:
+                if self.escape:
+                    self.escape = False
+                elif ch == "\\":
+                    self.escape = True
+                elif ch == '"':
+                    self.in_string = False
+            elif not self.started:
+                if ch == "{":
+                    self.started = True
+                    self.depth = 1
+            elif ch == '"':
+                self.in_string = True
+            elif ch == "{":
+                self.depth += 1
+            elif ch == "}":
+                self.depth -= 1
+                if self.depth == 0:
+                    return self.consumed + i + 1
+        self.consumed += len(text)
+        return -1
+
+
+async def _stream_json_text(model: "genai.GenerativeModel", prompt: str) -> str:
+    """
+    Stream a Gemini response, stopping as soon as the root JSON object is complete
+    
+    Returns:
+        The response text up to the object's closing brace (the whole text if
+        it never closes, so the caller's JSON parsing reports the problem)
+    """
+    response = await model.generate_content_async(
+        prompt,
+        stream=True,
+        generation_config=_ANALYSIS_GENERATION_CONFIG
+    )
+    scanner = _JsonObjectScanner()
+    parts = []
+    async for chunk in response:
+        parts.append(chunk.text)
+        end = scanner.feed(chunk.text)
+        if end >= 0:
+            # Anything after the object (a closing fence, trailing prose) is dropped
+            return "".join(parts)[:end]
+    return "".join(parts)
+
+
+# Used when the account lists them, in this order; otherwise the first listed model
+_PREFERRED_GEMINI_MODELS = ('gemini-1.5-flash-latest', 'gemini-2.0-flash-exp', 'gemini-1.5-pro', 'gemini-pro')
+
+
+def _resolve_gemini_model_name() -> str:
+    """Pick the model to analyze with: the first preferred one that's available, else any available"""
+    try:
+        available_models = _available_gemini_models()
+    except Exception as e:
+        logger.warning(f"Could not list models: {e}. Will use {_PREFERRED_GEMINI_MODELS[0]}.")
+        return _PREFERRED_GEMINI_MODELS[0]
+    
+    for preferred in _PREFERRED_GEMINI_MODELS:
+        if preferred in available_models:
+            return preferred
+    if available_models:
+        return available_models[0]
+    return _PREFERRED_GEMINI_MODELS[0]
+
+
+# ==================== Whisper ====================
+# Loaded Whisper models shared by every VideoAnalyzer in the process, keyed by
+# (model_name, device, compute_type); weights are read from disk once.
+# Entries are (model, batched pipeline, inference lock)
+_MODEL_CACHE: Dict[tuple, Tuple[Any, Any, Optional[threading.Lock]]] = {}
+# Transcriptions run on worker threads; only one of them loads a given model
+_MODEL_CACHE_LOCK = threading.Lock()
+
+
+def _compile_whisper_encoder(model: Any) -> None:
+    """
+    Wrap an openai-whisper model's audio encoder with torch.compile
+    
+    Only the encoder is compiled: transcribe() pads every window to a 30 s
+    mel, so its input shape never changes. The decoder's token and kv-cache
+    lengths grow on every step and would recompile per shape. The default
+    mode is used, not "reduce-overhead": its CUDA graphs reuse static output
+    buffers, which is unsafe for a model shared across threads.
+    
+    Compilation happens lazily on the first forward pass and takes tens of
+    seconds, so a 1 s silent clip (padded to the same 30 s window) is
+    transcribed here, at load time, instead of inside the first request. If
+    compilation fails the eager encoder is restored.
+    """
+    if not hasattr(torch, "compile"):
+        return  # torch < 2.0
+    encoder = model.encoder
+    try:
+        model.encoder = torch.compile(encoder)
+        logger.info("Compiling Whisper encoder (one-time warmup)")
+        model.transcribe(torch.zeros(16000, device="cuda"))
+    except Exception as e:
+        logger.warning(f"torch.compile failed, using eager Whisper: {e}")
+        model.encoder = encoder
+
+
+def _load_shared_whisper(model_name: str, compute_type: str) -> Tuple[Any, Any, Optional[threading.Lock]]:
+    """
+    Load a Whisper model once per process, preferring faster-whisper over openai-whisper
+    
+    The inference lock must be held around transcribe() on the shared model.
+    openai-whisper installs kv-cache hooks on the decoder for each call, so
+    concurrent calls would corrupt each other. CTranslate2 models are
+    thread-safe (with the default num_workers=1 concurrent calls queue
+    inside CTranslate2), so faster-whisper gets no lock.
+    
+    Returns:
+        Tuple of (model, BatchedInferencePipeline or None, inference lock or None)
+    """
+    if FASTER_WHISPER_AVAILABLE:
+        use_gpu = ctranslate2.get_cuda_device_count() > 0
+        device = "cuda" if use_gpu else "cpu"
+        if compute_type == "auto":
+            compute_type = "int8_float16" if use_gpu else "int8"
+    else:
+        # openai-whisper has no compute_type (fp16 on CUDA, fp32 on CPU)
+        device = "cuda" if torch.cuda.is_available() else "cpu"
+        compute_type = "default"
+    
+    key = (model_name, device, compute_type)
+    cached = _MODEL_CACHE.get(key)
+    if cached is not None:
+        return cached
+    
+    with _MODEL_CACHE_LOCK:
+        cached = _MODEL_CACHE.get(key)
+        if cached is None:
+            logger.info(f"Loading Whisper model: {model_name}")
+            try:
+                if FASTER_WHISPER_AVAILABLE:
+                    model = WhisperModel(model_name, device=device, compute_type=compute_type)
+                    batched = BatchedInferencePipeline(model=model) if BatchedInferencePipeline is not None else None
+                    inference_lock = None
+                else:
+                    model, batched = whisper.load_model(model_name, device=device), None
+                    inference_lock = threading.Lock()
+                    if device == "cuda":
+                        # Not yet published, so the warmup needs no inference lock
+                        _compile_whisper_encoder(model)
+                logger.info("Whisper model loaded successfully")
+            except Exception as e:
+                logger.error(f"Failed to load Whisper model: {e}")
+                raise
+            cached = _MODEL_CACHE[key] = (model, batched, inference_lock)
+    return cached
+
+
 # ==================== Video Analyzer ====================
 class VideoAnalyzer:
     """Handles video analysis workflow"""
@@ -202,29 +497,57 @@ class VideoAnalyzer:
         self, 
         gemini_api_key: str, 
         whisper_model: str = "base",
+        compute_type: str = "auto",
         use_alternative_transcription: bool = False,
         transcription_service: str = "whisper",
-        transcription_api_key: Optional[str] = None
+        transcription_api_key: Optional[str] = None,
+        analysis_cache_dir: Optional[str] = None
     ):
         """
         Initialize the video analyzer
         
         Args:
             gemini_api_key: Google Gemini API key
-            whisper_model: Whisper model size (tiny, base, small, medium, large)
+            whisper_model: Whisper model size (tiny, base, small, medium, large).
+                With faster-whisper, distilled models such as "distil-large-v3"
+                also work: about 2x faster than large-v3 at similar accuracy
+                (English only)
+            compute_type: faster-whisper weight/activation precision. "auto"
+                picks int8_float16 on GPU and int8 on CPU, which roughly
+                halve memory bandwidth against float16/float32 with a small
+                accuracy cost; "float16"/"bfloat16" (GPU) or "float32" trade
+                speed back for accuracy. Ignored by openai-whisper
             use_alternative_transcription: Use API-based transcription instead of Whisper
             transcription_service: Service to use (whisper, google, assemblyai)
             transcription_api_key: API key for alternative transcription service
+            analysis_cache_dir: Directory for cached Gemini analyses (keyed by
+                transcript and prompt version); None disables the cache
+        
+        Thread-safe: sets instance state, (idempotently) configures the Gemini
+        client and resolves the Gemini model (one cached list_models call),
+        so it can be constructed on a worker thread.
         """
         self.gemini_api_key = gemini_api_key
         self.whisper_model_name = whisper_model
+        self.compute_type = compute_type
         self.whisper_model = None
+        self.batched_whisper = None
+        self.whisper_inference_lock = None
         self.use_alternative_transcription = use_alternative_transcription
         self.transcription_service_name = transcription_service
         self.transcription_api_key = transcription_api_key
         self.alternative_transcriber = None
+        self.analysis_cache = None
+        self.gemini_model = None
+        
+        if analysis_cache_dir:
+            try:
+                self.analysis_cache = AnalysisCache(analysis_cache_dir)
+            except OSError as e:
+                logger.warning(f"Analysis cache disabled, cannot use {analysis_cache_dir}: {e}")
         
         genai.configure(api_key=gemini_api_key)
+        self._resolve_gemini_model()
         
         # Initialize alternative transcription if needed
         if use_alternative_transcription:
@@ -238,37 +561,101 @@ class VideoAnalyzer:
                 logger.warning(f"Failed to initialize alternative transcription: {e}")
     
     def load_whisper_model(self):
-        """Load Whisper model (lazy loading)"""
-        if not WHISPER_AVAILABLE:
+        """Load Whisper model (lazy loading), preferring faster-whisper over openai-whisper"""
+        if not LOCAL_TRANSCRIPTION_AVAILABLE:
             raise Exception(
                 "Whisper is not available. "
-                "Please install openai-whisper (requires Python 3.10-3.13) "
+                "Please install faster-whisper or openai-whisper (requires Python 3.10-3.13) "
                 "or use an alternative transcription method."
             )
         
-        if self.whisper_model is None:
-            logger.info(f"Loading Whisper model: {self.whisper_model_name}")
+        if self.whisper_model is not None:
+            return
+        # Shared per process: every analyzer (and request) reuses one loaded model
+        model, batched, inference_lock = _load_shared_whisper(self.whisper_model_name, self.compute_type)
+        self.batched_whisper = batched
+        self.whisper_inference_lock = inference_lock
+        # Published last: other threads only check whisper_model
+        self.whisper_model = model
+    
+    def warmup(self) -> None:
+        """Load Whisper ahead of the first request if transcription will run locally"""
+        if self._uses_alternative_transcription() or not LOCAL_TRANSCRIPTION_AVAILABLE:
+            return
+        try:
+            self.load_whisper_model()
+        except Exception as e:
+            # The first transcription retries the load and reports the error
+            logger.warning(f"Whisper warmup failed: {e}")
+    
+    async def _run_ffmpeg(self, cmd: list) -> bytes:
+        """
+        Run an ffmpeg command without blocking the event loop
+        
+        Returns:
+            ffmpeg's stdout
+        """
+        try:
+            proc = await asyncio.create_subprocess_exec(
+                *cmd,
+                stdin=asyncio.subprocess.DEVNULL,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE
+            )
+        except FileNotFoundError:
+            raise Exception("ffmpeg is not installed. Please install ffmpeg first.")
+        except NotImplementedError:
+            # Windows selector event loop (uvicorn installs it for reload or
+            # multiple workers) can't spawn subprocesses: wait on a thread instead
+            returncode, stdout, stderr = await self._run_ffmpeg_in_thread(cmd)
+        else:
             try:
-                self.whisper_model = whisper.load_model(self.whisper_model_name)
-                logger.info("Whisper model loaded successfully")
-            except Exception as e:
-                logger.error(f"Failed to load Whisper model: {e}")
+                stdout, stderr = await proc.communicate()
+            except asyncio.CancelledError:
+                # Request went away mid-decode: don't leave ffmpeg running
+                proc.kill()
+                await proc.wait()
                 raise
+            returncode = proc.returncode
+        
+        if returncode != 0:
+            stderr_text = stderr.decode(errors="replace")
+            logger.error(f"FFmpeg error: {stderr_text}")
+            raise Exception(f"Failed to extract audio: {stderr_text}")
+        return stdout
+    
+    async def _run_ffmpeg_in_thread(self, cmd: list) -> Tuple[int, bytes, bytes]:
+        """Run ffmpeg with a blocking Popen.communicate on a worker thread; works on any event loop"""
+        try:
+            proc = subprocess.Popen(
+                cmd,
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE
+            )
+        except FileNotFoundError:
+            raise Exception("ffmpeg is not installed. Please install ffmpeg first.")
+        
+        try:
+            stdout, stderr = await asyncio.to_thread(proc.communicate)
+        except asyncio.CancelledError:
+            # The worker thread's communicate() returns once ffmpeg is gone
+            proc.kill()
+            raise
+        return proc.returncode, stdout, stderr
+    
+    def _check_ffmpeg(self) -> None:
+        """Raise if the ffmpeg binary isn't on PATH"""
+        if not FFMPEG_AVAILABLE:
+            raise Exception("ffmpeg is not installed. Please install ffmpeg first.")
     
-    def extract_audio(self, video_path: str, output_audio_path: str) -> str:
+    async def extract_audio(self, video_path: str, output_audio_path: str) -> str:
         """Extract audio from video file using ffmpeg"""
         try:
             logger.info(f"Extracting audio from video: {video_path}")
             
             # Check if ffmpeg is available
-            try:
-                subprocess.run(
-                    ["ffmpeg", "-version"],
-                    capture_output=True,
-                    check=True
-                )
-            except (subprocess.CalledProcessError, FileNotFoundError):
-                raise Exception("ffmpeg is not installed. Please install ffmpeg first.")
+            self._check_ffmpeg()
             
             # Extract audio using ffmpeg
             cmd = [
@@ -282,40 +669,159 @@ class VideoAnalyzer:
                 output_audio_path
             ]
             
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                check=True
-            )
+            await self._run_ffmpeg(cmd)
             
             logger.info(f"Audio extracted successfully to: {output_audio_path}")
             return output_audio_path
         
-        except subprocess.CalledProcessError as e:
-            logger.error(f"FFmpeg error: {e.stderr}")
-            raise Exception(f"Failed to extract audio: {e.stderr}")
         except Exception as e:
             logger.error(f"Error extracting audio: {e}")
             raise
     
-    def transcribe_audio(self, audio_path: str) -> str:
-        """Transcribe audio using Whisper model or alternative method"""
+    def _decode_audio_pyav(self, video_path: str):
+        """
+        Decode the first audio track to 16 kHz mono float32 in-process with PyAV
+        
+        libav converts to mono float32; with soxr installed it keeps the
+        source rate and soxr does the rate conversion (skipped entirely when
+        the source is already 16 kHz), otherwise libav resamples too.
+        """
+        import numpy as np  # installed with either Whisper backend
+        
+        try:
+            with av.open(video_path) as container:
+                if not container.streams.audio:
+                    raise Exception("Failed to extract audio: the video has no audio track")
+                stream = container.streams.audio[0]
+                stream.thread_type = "AUTO"
+                source_rate = stream.rate or 16000
+                decode_rate = source_rate if SOXR_AVAILABLE else 16000
+                resampler = av.AudioResampler(format="flt", layout="mono", rate=decode_rate)
+                
+                chunks = []
+                for frame in container.decode(stream):
+                    for resampled in resampler.resample(frame):
+                        chunks.append(resampled.to_ndarray().reshape(-1))
+                # Drain samples still buffered in the resampler
+                for resampled in resampler.resample(None):
+                    chunks.append(resampled.to_ndarray().reshape(-1))
+        except av.error.FFmpegError as e:
+            raise Exception(f"Failed to extract audio: {e}")
+        
+        if not chunks:
+            return np.zeros(0, dtype=np.float32)
+        audio = np.concatenate(chunks)
+        if decode_rate != 16000:
+            audio = soxr.resample(audio, decode_rate, 16000, quality="HQ")
+        return audio
+    
+    async def extract_audio_array(self, video_path: str):
+        """
+        Decode the audio track straight into memory for local Whisper
+        
+        With PyAV installed the audio is decoded in-process (on a worker
+        thread); otherwise ffmpeg writes 16 kHz mono s16le PCM to stdout.
+        Either way the audio never touches the disk.
+        
+        Returns:
+            float32 numpy array in [-1, 1], as both Whisper backends expect
+        """
+        import numpy as np  # installed with either Whisper backend
+        
+        try:
+            logger.info(f"Extracting audio from video: {video_path}")
+            
+            if PYAV_AVAILABLE:
+                audio = await asyncio.to_thread(self._decode_audio_pyav, video_path)
+                logger.info(f"Audio extracted successfully: {audio.shape[0] / 16000:.1f} seconds")
+                return audio
+            
+            # Check if ffmpeg is available
+            self._check_ffmpeg()
+            
+            cmd = [
+                "ffmpeg",
+                "-i", video_path,
+                "-vn",  # No video
+                "-f", "s16le",  # Raw PCM 16-bit little-endian, no WAV header
+                "-acodec", "pcm_s16le",
+                "-ar", "16000",  # 16kHz sample rate (optimal for Whisper)
+                "-ac", "1",  # Mono channel
+                "pipe:1"
+            ]
+            
+            pcm = await self._run_ffmpeg(cmd)
+            
+            audio = np.frombuffer(pcm, np.int16).astype(np.float32) / 32768.0
+            logger.info(f"Audio extracted successfully: {audio.shape[0] / 16000:.1f} seconds")
+            return audio
+        
+        except Exception as e:
+            logger.error(f"Error extracting audio: {e}")
+            raise
+    
+    def _resolve_gemini_model(self) -> "genai.GenerativeModel":
+        """Resolve the Gemini model used for analysis, once (again after it 404s)"""
+        model = self.gemini_model
+        if model is None:
+            model_name = _resolve_gemini_model_name()
+            logger.info(f"Using Gemini model: {model_name}")
+            model = self.gemini_model = genai.GenerativeModel(model_name)
+        return model
+    
+    def _uses_alternative_transcription(self) -> bool:
+        """True if an API-based service (not local Whisper) transcribes the audio"""
+        return bool(self.use_alternative_transcription and self.alternative_transcriber)
+    
+    def transcribe_audio(self, audio: Union[str, Any]) -> str:
+        """
+        Transcribe audio using Whisper model or alternative method
+        
+        Args:
+            audio: Path to an audio file, or a 16 kHz float32 array (Whisper only)
+        """
         try:
-            logger.info(f"Transcribing audio: {audio_path}")
+            if isinstance(audio, str):
+                logger.info(f"Transcribing audio: {audio}")
+            else:
+                logger.info(f"Transcribing {audio.shape[0] / 16000:.1f} seconds of in-memory audio")
             
             # Use alternative transcription if configured
-            if self.use_alternative_transcription and self.alternative_transcriber:
+            if self._uses_alternative_transcription():
                 logger.info(f"Using {self.transcription_service_name} for transcription")
-                transcript = self.alternative_transcriber.transcribe(audio_path)
+                transcript = self.alternative_transcriber.transcribe(audio)
                 logger.info(f"Transcription completed using {self.transcription_service_name}. Length: {len(transcript)} characters")
                 return transcript
             
             # Try Whisper
-            if WHISPER_AVAILABLE:
+            if LOCAL_TRANSCRIPTION_AVAILABLE:
                 self.load_whisper_model()
-                result = self.whisper_model.transcribe(audio_path)
-                transcript = result["text"].strip()
+                if self.batched_whisper is not None:
+                    # VAD-chunked speech transcribed in batches instead of one
+                    # sequential pass over the whole recording; segments come
+                    # back in order
+                    segments, _info = self.batched_whisper.transcribe(
+                        audio,
+                        beam_size=1,
+                        batch_size=WHISPER_BATCH_SIZE
+                    )
+                    transcript = "".join(segment.text for segment in segments).strip()
+                elif FASTER_WHISPER_AVAILABLE:
+                    # Greedy decoding, silence skipped by VAD; segments are
+                    # generated lazily as they are joined
+                    segments, _info = self.whisper_model.transcribe(
+                        audio,
+                        beam_size=1,
+                        vad_filter=True,
+                        condition_on_previous_text=False
+                    )
+                    transcript = "".join(segment.text for segment in segments).strip()
+                else:
+                    # transcribe() runs on a worker thread and the model is
+                    # shared process-wide; its decoder hooks aren't thread-safe
+                    with self.whisper_inference_lock:
+                        result = self.whisper_model.transcribe(audio)
+                    transcript = result["text"].strip()
                 logger.info(f"Transcription completed using Whisper. Length: {len(transcript)} characters")
                 return transcript
             else:
@@ -323,7 +829,8 @@ class VideoAnalyzer:
                 error_msg = (
                     "No transcription service available. "
                     "Options:\n"
-                    "1. Install openai-whisper (requires Python 3.10-3.13): pip install openai-whisper\n"
+                    "1. Install faster-whisper: pip install faster-whisper\n"
+                    "   (or openai-whisper, requires Python 3.10-3.13: pip install openai-whisper)\n"
                     "2. Configure alternative transcription service in settings"
                 )
                 logger.error(error_msg)
@@ -333,131 +840,48 @@ class VideoAnalyzer:
             logger.error(f"Error transcribing audio: {e}")
             raise
     
-    def analyze_with_gemini(self, transcript: str) -> Dict[str, Any]:
+    async def analyze_with_gemini(self, transcript: str) -> Dict[str, Any]:
         """Analyze transcript using Google Gemini API"""
+        cache_key = None
+        if self.analysis_cache is not None:
+            # Identical transcripts (re-uploads) reuse the earlier analysis
+            cache_key = AnalysisCache.make_key(PROMPT_VERSION, transcript)
+            cached = await asyncio.to_thread(self.analysis_cache.get, cache_key)
+            if cached is not None:
+                logger.info("Using cached Gemini analysis for this transcript")
+                return cached
+        
         try:
             logger.info("Sending transcript to Gemini for analysis")
             
-            # List available models and find one that supports generateContent
-            available_models = []
-            preferred_models = ['gemini-1.5-flash-latest', 'gemini-2.0-flash-exp', 'gemini-1.5-pro', 'gemini-pro']
-            
-            try:
-                logger.info("Listing available Gemini models...")
-                for model in genai.list_models():
-                    if 'generateContent' in model.supported_generation_methods:
-                        model_name = model.name.replace('models/', '')
-                        available_models.append(model_name)
-                        logger.info(f"Found available model: {model_name}")
-            except Exception as e:
-                logger.warning(f"Could not list models: {e}. Will try predefined models.")
-            
-            # Build list of models to try (preferred models first, then any available)
-            model_names = []
-            
-            # Add preferred models that are available
-            for preferred in preferred_models:
-                if available_models and preferred in available_models:
-                    model_names.append(preferred)
-                elif not available_models:  # If we couldn't list, try anyway
-                    model_names.append(preferred)
-            
-            # Add other available models that weren't in preferred list
-            if available_models:
-                for model in available_models:
-                    if model not in model_names:
-                        model_names.append(model)
-            
-            # Fallback if no models found
-            if not model_names:
-                model_names = preferred_models + ['gemini-1.5-flash']
-            
-            logger.info(f"Will try models in order: {model_names}")
-            
             # Create analysis prompt
-            prompt = f"""Analyze the following interview transcript and provide a detailed analysis in JSON format.
-
-Transcript:
-{transcript}
-
-Please provide your analysis in the following JSON structure:
-{{
-    "is_interview": true/false,
-    "summary": "Concise summary of the discussion",
-    "key_questions": ["Question 1", "Question 2", ...],
-    "tone_and_professionalism": "Description of tone and professionalism",
-    "rating": 0-10,
-    "technical_strengths": ["Strength 1", "Strength 2", ...],
-    "technical_weaknesses": ["Weakness 1", "Weakness 2", ...],
-    "communication_rating": 0-10,
-    "technical_knowledge_rating": 0-10,
-    "follow_up_questions": ["Question 1", "Question 2", ...],
-    "interviewer_review": "Review and evaluation of the INTERVIEWER's performance: Assess how well the interviewer conducted the interview. Evaluate the quality of questions asked, questioning techniques (open-ended vs closed, leading questions, clarity), interviewer's communication style, ability to probe deeper, active listening skills, professionalism, whether they covered all necessary topics, fairness in their approach, and overall interviewing effectiveness. This should focus on the interviewer's skills and conduct, NOT the candidate's performance."
-}}
+            prompt = "".join((_PROMPT_PREFIX, transcript, _PROMPT_SUFFIX))
 
-Focus on:
-- React.js, Node.js, and general software engineering knowledge
-- Technical communication skills
-- Problem-solving approach
-- Code quality discussions
-- System design understanding
-
-Return only valid JSON, no additional text or markdown formatting."""
-
-            # Try to generate analysis - if model fails, try next one
-            response = None
-            last_error = None
-            
-            for model_name in model_names:
-                try:
-                    logger.info(f"Attempting to generate content with model: {model_name}")
-                    model = genai.GenerativeModel(model_name)
-                    response = model.generate_content(prompt)
-                    logger.info(f"Successfully generated content with model: {model_name}")
-                    break
-                except Exception as e:
-                    error_str = str(e).lower()
-                    last_error = e
-                    # Check if it's a model not found error
-                    if "not found" in error_str or "404" in error_str or "is not found" in error_str:
-                        logger.warning(f"Model {model_name} not found (404), trying next model...")
-                        continue
-                    else:
-                        # Different error, might be API key or other issue
-                        logger.error(f"Error with model {model_name}: {e}")
-                        if model_name == model_names[-1]:  # Last model, re-raise
-                            raise
-                        continue
-            
-            if response is None:
-                available_info = f"Available models: {', '.join(available_models)}" if available_models else "Could not list available models"
-                raise Exception(
-                    f"Failed to generate content with any available Gemini model. "
-                    f"{available_info}. "
-                    f"Tried models: {', '.join(model_names)}. "
-                    f"Last error: {last_error}. "
-                    f"Please check your API key and verify model availability."
-                )
-            
-            # Parse response
-            response_text = response.text.strip()
-            
-            # Remove markdown code blocks if present
-            if response_text.startswith("```json"):
-                response_text = response_text[7:]
-            if response_text.startswith("```"):
-                response_text = response_text[3:]
-            if response_text.endswith("```"):
-                response_text = response_text[:-3]
-            response_text = response_text.strip()
+            # One request to the model resolved up front; no per-call model probing
+            model = self.gemini_model or await asyncio.to_thread(self._resolve_gemini_model)
+            try:
+                response_text = await _stream_json_text(model, prompt)
+            except Exception as e:
+                error_str = str(e).lower()
+                if "not found" in error_str or "404" in error_str:
+                    # Model retired since it was resolved: list and resolve again next time
+                    _available_gemini_models.cache_clear()
+                    self.gemini_model = None
+                logger.error(f"Error with model {model.model_name}: {e}")
+                raise
+            logger.info(f"Successfully generated content with model: {model.model_name}")
             
             # Try to parse JSON
-            analysis = json.loads(response_text)
+            # orjson parses the str directly (no separate encode step needed)
+            analysis = orjson.loads(response_text)
             
             logger.info("Gemini analysis completed successfully")
+            if cache_key is not None:
+                # Only parsed results are cached, never the fallback below
+                await asyncio.to_thread(self.analysis_cache.set, cache_key, analysis)
             return analysis
         
-        except json.JSONDecodeError as e:
+        except orjson.JSONDecodeError as e:
             logger.error(f"Failed to parse Gemini response as JSON: {e}")
             logger.error(f"Response: {response_text[:500]}")
             # Return a fallback response
@@ -478,49 +902,52 @@ Return only valid JSON, no additional text or markdown formatting."""
             logger.error(f"Error analyzing with Gemini: {e}")
             raise
     
-    def process_video(self, video_file_path: str) -> Dict[str, Any]:
+    async def process_video(self, video_file_path: str) -> Dict[str, Any]:
         """
         Complete video processing pipeline:
         1. Extract audio
         2. Transcribe audio
         3. Analyze with Gemini
         
+        ffmpeg runs as an async subprocess, transcription on a worker thread
+        and Gemini through the SDK's async client, so the event loop is never
+        blocked.
+        
         Args:
             video_file_path: Path to uploaded video file
         
         Returns:
             Complete analysis results
         """
-        temp_audio_path = None
-        
-        try:
-            # Create temporary directory for audio
-            temp_dir = tempfile.mkdtemp()
-            temp_audio_path = os.path.join(temp_dir, "extracted_audio.wav")
-            
-            # Step 1: Extract audio
-            self.extract_audio(video_file_path, temp_audio_path)
-            
-            # Step 2: Transcribe
-            transcript = self.transcribe_audio(temp_audio_path)
-            
-            # Step 3: Analyze with Gemini
-            analysis = self.analyze_with_gemini(transcript)
-            
-            # Combine results
-            result = {
-                "transcript": transcript,
-                **analysis
-            }
+        # Step 1: Extract audio. Whisper takes the samples straight from
+        # ffmpeg's stdout; the API-based services need a WAV file to upload
+        # (so does the no-backend path, which fails with setup instructions).
+        # The temp directory and everything in it is removed on exit, even on errors
+        with tempfile.TemporaryDirectory(prefix="interview-", ignore_cleanup_errors=True) as temp_dir:
+            if self._uses_alternative_transcription() or not LOCAL_TRANSCRIPTION_AVAILABLE:
+                temp_audio_path = os.path.join(temp_dir, "extracted_audio.wav")
+                audio = await self.extract_audio(video_file_path, temp_audio_path)
+            elif self.whisper_model is None:
+                # Cold analyzer: load Whisper on a worker thread while the audio
+                # is decoded, instead of after it
+                audio, _ = await asyncio.gather(
+                    self.extract_audio_array(video_file_path),
+                    asyncio.to_thread(self.load_whisper_model)
+                )
+            else:
+                audio = await self.extract_audio_array(video_file_path)
             
-            return result
-        
-        finally:
-            # Cleanup temporary files
-            if temp_audio_path and os.path.exists(temp_audio_path):
-                try:
-                    os.remove(temp_audio_path)
-                    os.rmdir(os.path.dirname(temp_audio_path))
-                except Exception as e:
-                    logger.warning(f"Failed to cleanup temp files: {e}")
+            # Step 2: Transcribe (CPU/GPU-bound, or a blocking API client)
+            transcript = await asyncio.to_thread(self.transcribe_audio, audio)
+        
+        # Step 3: Analyze with Gemini
+        analysis = await self.analyze_with_gemini(transcript)
+        
+        # Combine results
+        result = {
+            "transcript": transcript,
+            **analysis
+        }
+        
+        return result
 
@@ -1,6 +1,9 @@
 """
 Main application entry point
 """
+import os
+import sys
+
 from app.controller.main_controller import create_app, setup_routes
 from app.db.database import get_settings
 import uvicorn
@@ -13,5 +16,16 @@ setup_routes(app)
 
 if __name__ == "__main__":
     settings = get_settings()
-    uvicorn.run(app, host="0.0.0.0", port=8001, reload=settings.DEBUG)
-
+    # Reload and multiple workers both need the app as an import string.
+    # Reload runs a single process, so workers only apply outside DEBUG;
+    # each worker loads its own Whisper model and analysis semaphore.
+    uvicorn.run(
+        "main:app",
+        host="0.0.0.0",
+        port=8001,
+        reload=settings.DEBUG,
+        workers=None if settings.DEBUG else (settings.WORKERS or os.cpu_count()),
+        # uvloop doesn't support Windows (uvicorn[standard] skips it there)
+        loop="auto" if sys.platform == "win32" else "uvloop",
+        http="httptools"
+    )
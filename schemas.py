@@ -1,7 +1,7 @@
 """
 Pydantic models for request/response schemas
 """
-from pydantic import BaseModel, EmailStr
+from pydantic import BaseModel, EmailStr, Field
 from typing import Optional, List, Dict, Any
 from datetime import datetime
 
@@ -10,7 +10,7 @@ class BaseResponse(BaseModel):
     """Base response model"""
     success: bool = True
     message: str = "Success"
-    timestamp: datetime = datetime.now()
+    timestamp: datetime = Field(default_factory=datetime.now)  # Per response, not at import
 
 
 class ErrorResponse(BaseResponse):
@@ -25,7 +25,7 @@ class HealthCheckResponse(BaseModel):
     status: str = "healthy"
     service: str
     version: str = "1.0.0"
-    timestamp: datetime = datetime.now()
+    timestamp: datetime = Field(default_factory=datetime.now)  # Per response, not at import
 
 
 # AI Service Models
@@ -67,6 +67,28 @@ class VideoAnalysisResponse(BaseModel):
     processing_time: Optional[float] = None
 
 
+class BatchVideoUrlRequest(BaseModel):
+    """Batch video URL analysis request model"""
+    video_urls: List[str]
+
+
+class BatchVideoAnalysisItem(BaseModel):
+    """Outcome of analyzing one URL in a batch"""
+    video_url: str
+    success: bool
+    result: Optional[VideoAnalysisResponse] = None
+    status_code: Optional[int] = None  # HTTP status the single-URL endpoint would have returned
+    error: Optional[str] = None
+
+
+class BatchVideoAnalysisResponse(BaseModel):
+    """Batch video analysis response model"""
+    results: List[BatchVideoAnalysisItem]  # Same order as the requested URLs
+    succeeded: int
+    failed: int
+    processing_time: Optional[float] = None
+
+
 # User Service Models
 class UserBase(BaseModel):
     """Base user model"""
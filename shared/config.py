@@ -2,6 +2,8 @@
 Shared configuration settings for all microservices
 """
 import os
+import tempfile
+from functools import lru_cache
 from pathlib import Path
 from pydantic_settings import BaseSettings
 from typing import Optional
@@ -34,6 +36,12 @@ def find_project_root():
     return str(project_root)
 
 
+# Resolved once at import; serverless platforms provide settings via the environment instead
+_IS_SERVERLESS = bool(os.getenv("VERCEL") or os.getenv("AWS_LAMBDA_FUNCTION_NAME"))
+_PROJECT_ROOT = find_project_root()
+_ENV_FILE = None if _IS_SERVERLESS else os.path.join(_PROJECT_ROOT, ".env")
+
+
 class Settings(BaseSettings):
     """Base settings class for microservices"""
     
@@ -41,6 +49,8 @@ class Settings(BaseSettings):
     SERVICE_NAME: str = "microservice"
     DEBUG: bool = True
     LOG_LEVEL: str = "INFO"
+    # Server processes for `python main.py` (None: one per CPU); ignored when DEBUG reloads
+    WORKERS: Optional[int] = None
     
     # API Gateway
     API_GATEWAY_HOST: str = "http://localhost:8000"
@@ -61,8 +71,11 @@ class Settings(BaseSettings):
     
     # AI Service - Video Analyzer
     GEMINI_API_KEY: Optional[str] = None  # Set in .env file
-    WHISPER_MODEL: str = "base"  # Options: tiny, base, small, medium, large
+    WHISPER_MODEL: str = "base"  # Options: tiny, base, small, medium, large (faster-whisper also: distil-large-v3)
+    WHISPER_COMPUTE_TYPE: str = "auto"  # faster-whisper only: auto, int8, int8_float16, float16, bfloat16, float32
     MAX_VIDEO_SIZE_MB: int = 5000  # Maximum video file size in MB
+    # Cached Gemini analyses, keyed by transcript hash; set to "" to disable
+    ANALYSIS_CACHE_DIR: Optional[str] = os.path.join(tempfile.gettempdir(), "interview-analyses")
     
     # Alternative transcription (when Whisper not available)
     USE_ALTERNATIVE_TRANSCRIPTION: bool = True  # Prefer API-based transcription on serverless
@@ -72,12 +85,13 @@ class Settings(BaseSettings):
     class Config:
         # In serverless environments, don't use .env file - use environment variables directly
         # pydantic-settings will automatically read from os.environ if env_file doesn't exist
-        env_file = None if (os.getenv("VERCEL") or os.getenv("AWS_LAMBDA_FUNCTION_NAME")) else os.path.join(find_project_root(), ".env")
+        env_file = _ENV_FILE
         env_file_encoding = "utf-8"
         case_sensitive = True
 
 
+@lru_cache(maxsize=1)
 def get_settings() -> Settings:
-    """Get settings instance""" 
+    """Get settings instance (built once; .env and environment are read on first use)"""
     return Settings()
 